@@ -128,6 +128,8 @@ def findall_iter(
 def compile(
     pattern: str, extra_types: Mapping[str, Any] | None = None
 ) -> FormatParser: ...
+def cache_info() -> tuple[int, int, int, int]: ...
+def cache_clear() -> None: ...
 def extract_format(
     format_string: str, _match_dict: dict[str, Any] | None = None
 ) -> dict[str, Any]: ...
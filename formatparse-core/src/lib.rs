@@ -19,8 +19,9 @@ pub use lookaround::{
     rewrite_field_fragments_for_engine_anchor, split_type_base_and_lookaround_tail,
 };
 pub use parser::pattern::{
-    field_types_match, parse_field, parse_field_path, parse_format_spec, parse_pattern,
-    validate_multiline_mvp, ParsedPatternParts, MAX_NESTED_FORMAT_DEPTH,
+    field_types_match, literal_affixes, longest_required_literal, parse_field, parse_field_path,
+    parse_format_spec, parse_pattern, required_literals, validate_multiline_mvp,
+    ParsedPatternParts, MAX_NESTED_FORMAT_DEPTH,
 };
 pub use parser::{
     count_capturing_groups, validate_field_name, validate_input_length, validate_pattern_length,
@@ -470,6 +470,110 @@ pub fn parse_pattern(
     ))
 }
 
+/// Literal runs that every match of `pattern` contains verbatim, in pattern order.
+///
+/// Follows [`parse_pattern`]: `{{` / `}}` unescape to single braces, and trailing whitespace of
+/// each run is dropped because it compiles to a flexible `\s+` / `\s*`; runs left empty are
+/// skipped. Returns an empty list when the pattern does not parse. Callers use the runs as a
+/// substring prefilter to reject haystacks before running the regex.
+pub fn required_literals(pattern: &str) -> Vec<String> {
+    fn push_run(runs: &mut Vec<String>, literal: &str) {
+        let run = literal.trim_end();
+        if !run.is_empty() {
+            runs.push(run.to_string());
+        }
+    }
+
+    let mut chars: std::iter::Peekable<std::str::Chars> = pattern.chars().peekable();
+    let mut literal = String::new();
+    let mut runs = Vec::new();
+
+    while let Some(ch) = chars.next() {
+        match ch {
+            '{' => {
+                if chars.peek() == Some(&'{') {
+                    chars.next();
+                    literal.push('{');
+                    continue;
+                }
+                push_run(&mut runs, &literal);
+                literal.clear();
+                if parse_field(&mut chars, 0).is_err() || chars.next() != Some('}') {
+                    return Vec::new();
+                }
+            }
+            '}' => {
+                if chars.peek() == Some(&'}') {
+                    chars.next();
+                }
+                literal.push('}');
+            }
+            _ => literal.push(ch),
+        }
+    }
+    push_run(&mut runs, &literal);
+    runs
+}
+
+/// Literal text that a full (anchored) match of `pattern` must start and end with.
+///
+/// The prefix is the literal before the first field, minus trailing whitespace (which
+/// compiles to a flexible `\s+` / `\s*`). The suffix is the literal after the last field and
+/// is only returned when it does not end in whitespace. A pattern without fields yields its
+/// literal for both. Either side is `None` when empty or when the pattern does not parse.
+pub fn literal_affixes(pattern: &str) -> (Option<String>, Option<String>) {
+    fn non_empty(run: &str) -> Option<String> {
+        (!run.is_empty()).then(|| run.to_string())
+    }
+
+    let mut chars: std::iter::Peekable<std::str::Chars> = pattern.chars().peekable();
+    let mut literal = String::new();
+    let mut prefix: Option<Option<String>> = None;
+
+    while let Some(ch) = chars.next() {
+        match ch {
+            '{' => {
+                if chars.peek() == Some(&'{') {
+                    chars.next();
+                    literal.push('{');
+                    continue;
+                }
+                if prefix.is_none() {
+                    prefix = Some(non_empty(literal.trim_end()));
+                }
+                literal.clear();
+                if parse_field(&mut chars, 0).is_err() || chars.next() != Some('}') {
+                    return (None, None);
+                }
+            }
+            '}' => {
+                if chars.peek() == Some(&'}') {
+                    chars.next();
+                }
+                literal.push('}');
+            }
+            _ => literal.push(ch),
+        }
+    }
+    let suffix = if literal.trim_end().len() == literal.len() {
+        non_empty(&literal)
+    } else {
+        None
+    };
+    let prefix = prefix.unwrap_or_else(|| non_empty(literal.trim_end()));
+    (prefix, suffix)
+}
+
+/// Longest of [`required_literals`] (the first one on ties), or `None` if there are none.
+pub fn longest_required_literal(pattern: &str) -> Option<String> {
+    required_literals(pattern)
+        .into_iter()
+        .fold(None, |best: Option<String>, run| match best {
+            Some(b) if b.len() >= run.len() => Some(b),
+            _ => Some(run),
+        })
+}
+
 /// Normalize field name for use inside `(?P<name>...)` capture groups.
 ///
 /// Hyphens and dots become underscores (legacy parse compatibility). Dict-style paths use
@@ -913,3 +1017,70 @@ mod normalize_field_name_tests {
         assert_eq!(normalize_field_name("a[b[c[d]]]", &mut m, &[]), "a_b_c_d");
     }
 }
+
+#[cfg(test)]
+mod longest_required_literal_tests {
+    use super::{literal_affixes, longest_required_literal, required_literals};
+
+    #[test]
+    fn lists_runs_in_pattern_order() {
+        assert_eq!(
+            required_literals("Value: {v:d}, Count: {c:d}, Name: {n}"),
+            vec!["Value:", ", Count:", ", Name:"]
+        );
+        assert!(required_literals("{a}  {b}").is_empty());
+        assert!(required_literals("{unclosed").is_empty());
+    }
+
+    #[test]
+    fn picks_longest_trimmed_run() {
+        assert_eq!(
+            longest_required_literal("{name}: {age:d}").as_deref(),
+            Some(":")
+        );
+        assert_eq!(
+            longest_required_literal("Start: {data} End").as_deref(),
+            Some("Start:")
+        );
+        assert_eq!(
+            longest_required_literal("ID:{id:d}").as_deref(),
+            Some("ID:")
+        );
+    }
+
+    #[test]
+    fn unescapes_braces_and_skips_nested_fields() {
+        assert_eq!(
+            longest_required_literal("{{x}}{v:d}").as_deref(),
+            Some("{x}")
+        );
+        assert_eq!(
+            longest_required_literal("<{outer:{inner:d}}>").as_deref(),
+            Some("<")
+        );
+    }
+
+    #[test]
+    fn none_without_literals() {
+        assert_eq!(longest_required_literal("{}{}"), None);
+        assert_eq!(longest_required_literal("{a}  {b}"), None);
+        assert_eq!(longest_required_literal(""), None);
+    }
+
+    #[test]
+    fn affixes_anchor_leading_and_trailing_literals() {
+        let some = |s: &str| Some(s.to_string());
+        assert_eq!(
+            literal_affixes("Start: {data} End"),
+            (some("Start:"), some(" End"))
+        );
+        assert_eq!(literal_affixes("{name}: {age:d}"), (None, None));
+        assert_eq!(
+            literal_affixes("<{outer:{inner:d}}>"),
+            (some("<"), some(">"))
+        );
+        assert_eq!(literal_affixes("{{x}}{v:d} "), (some("{x}"), None));
+        assert_eq!(literal_affixes("plain"), (some("plain"), some("plain")));
+        assert_eq!(literal_affixes("{unclosed"), (None, None));
+    }
+}
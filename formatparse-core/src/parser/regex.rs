@@ -14,6 +14,11 @@ const MAX_REGEX_COMPILATION_TIME_MS: u128 = 500;
 
 /// Build a regex from a pattern string with DOTALL flag
 /// Includes timeout protection against ReDoS attacks
+///
+/// `fancy_regex` hands patterns without lookaround or backreferences to the `regex`
+/// crate whole, whose engines (lazy DFA, PikeVM, bounded backtracker) match in
+/// O(pattern × input) time however many ambiguous `{}` fields the pattern has. Only
+/// fields carrying lookaround tokens (issue #9) use the backtracking VM.
 pub fn build_regex(pattern: &str) -> Result<Regex, FormatParseError> {
     let start = Instant::now();
 
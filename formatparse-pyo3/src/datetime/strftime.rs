@@ -1,9 +1,18 @@
 use crate::datetime::common::get_month_map;
 use crate::error::regex_error;
+use once_cell::sync::Lazy;
 use pyo3::prelude::*;
 use pyo3::IntoPyObjectExt;
 use regex::Regex;
 
+// Date-only fallbacks, compiled once instead of on every conversion.
+static RE_YEAR_DAY_OF_YEAR: Lazy<Regex> = Lazy::new(|| Regex::new(r"^(\d{4})/(\d{1,3})$").unwrap());
+static RE_DAY_OF_YEAR: Lazy<Regex> = Lazy::new(|| Regex::new(r"^(\d{1,3})$").unwrap());
+static RE_FLEXIBLE_YMD_SLASH: Lazy<Regex> =
+    Lazy::new(|| Regex::new(r"^(\d{4})/(\d{1,2})/(\d{1,2})$").unwrap());
+static RE_FLEXIBLE_YMD_DASH: Lazy<Regex> =
+    Lazy::new(|| Regex::new(r"^(\d{4})-(\d{1,2})-(\d{1,2})$").unwrap());
+
 /// Check if a PyErr is a regex group redefinition error from strptime
 fn is_regex_group_redefinition_error(err: &PyErr) -> bool {
     let err_str = err.to_string();
@@ -319,38 +328,35 @@ pub fn parse_strftime_datetime(py: Python, value: &str, format_str: &str) -> PyR
         // Handle %j (day of year) specially
         if format_str.contains("%j") {
             // Parse day of year format
-            if let Ok(re) = Regex::new(r"^(\d{4})/(\d{1,3})$") {
-                if let Some(caps) = re.captures(value) {
-                    let year: i32 = caps.get(1).unwrap().as_str().parse().map_err(|_| {
+            if let Some(caps) = RE_YEAR_DAY_OF_YEAR.captures(value) {
+                let year: i32 =
+                    caps.get(1).unwrap().as_str().parse().map_err(|_| {
                         PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid year")
                     })?;
-                    let day_of_year: u16 = caps.get(2).unwrap().as_str().parse().map_err(|_| {
-                        PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid day of year")
-                    })?;
-                    // Create date from year and day of year
-                    let jan1 = date_class.call1((year, 1, 1))?;
-                    let timedelta = datetime_module.getattr("timedelta")?;
-                    let days = timedelta.call1((day_of_year as i32 - 1,))?;
-                    let add_method = jan1.getattr("__add__")?;
-                    let result_date = add_method.call1((days,))?;
-                    return result_date.into_py_any(py);
-                }
+                let day_of_year: u16 = caps.get(2).unwrap().as_str().parse().map_err(|_| {
+                    PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid day of year")
+                })?;
+                // Create date from year and day of year
+                let jan1 = date_class.call1((year, 1, 1))?;
+                let timedelta = datetime_module.getattr("timedelta")?;
+                let days = timedelta.call1((day_of_year as i32 - 1,))?;
+                let add_method = jan1.getattr("__add__")?;
+                let result_date = add_method.call1((days,))?;
+                return result_date.into_py_any(py);
             }
             // Handle %j without year (use current year)
-            if let Ok(re) = Regex::new(r"^(\d{1,3})$") {
-                if let Some(caps) = re.captures(value) {
-                    let today = datetime_class.call_method0("today")?;
-                    let year: i32 = today.getattr("year")?.extract()?;
-                    let day_of_year: u16 = caps.get(1).unwrap().as_str().parse().map_err(|_| {
-                        PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid day of year")
-                    })?;
-                    let jan1 = date_class.call1((year, 1, 1))?;
-                    let timedelta = datetime_module.getattr("timedelta")?;
-                    let days = timedelta.call1((day_of_year as i32 - 1,))?;
-                    let add_method = jan1.getattr("__add__")?;
-                    let result_date = add_method.call1((days,))?;
-                    return result_date.into_py_any(py);
-                }
+            if let Some(caps) = RE_DAY_OF_YEAR.captures(value) {
+                let today = datetime_class.call_method0("today")?;
+                let year: i32 = today.getattr("year")?.extract()?;
+                let day_of_year: u16 = caps.get(1).unwrap().as_str().parse().map_err(|_| {
+                    PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid day of year")
+                })?;
+                let jan1 = date_class.call1((year, 1, 1))?;
+                let timedelta = datetime_module.getattr("timedelta")?;
+                let days = timedelta.call1((day_of_year as i32 - 1,))?;
+                let add_method = jan1.getattr("__add__")?;
+                let result_date = add_method.call1((days,))?;
+                return result_date.into_py_any(py);
             }
         }
 
@@ -381,34 +387,23 @@ pub fn parse_strftime_datetime(py: Python, value: &str, format_str: &str) -> PyR
                 {
                     // Try to parse YYYY/MM/DD or YYYY/M/D format (flexible separators)
                     // Match the separator used in format_str
-                    let sep = if format_str.contains('/') {
-                        "/"
-                    } else if format_str.contains('-') {
-                        "-"
+                    let re: &Regex = if !format_str.contains('/') && format_str.contains('-') {
+                        &RE_FLEXIBLE_YMD_DASH
                     } else {
-                        "/"
+                        &RE_FLEXIBLE_YMD_SLASH
                     };
-                    let pattern = format!(
-                        r"^(\d{{4}})\{}(\d{{1,2}})\{}(\d{{1,2}})$",
-                        regex::escape(sep),
-                        regex::escape(sep)
-                    );
-                    if let Ok(re) = Regex::new(&pattern) {
-                        if let Some(caps) = re.captures(value) {
-                            let year: i32 =
-                                caps.get(1).unwrap().as_str().parse().map_err(|_| {
-                                    PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid year")
-                                })?;
-                            let month: u8 =
-                                caps.get(2).unwrap().as_str().parse().map_err(|_| {
-                                    PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid month")
-                                })?;
-                            let day: u8 = caps.get(3).unwrap().as_str().parse().map_err(|_| {
-                                PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid day")
-                            })?;
-                            let date = date_class.call1((year, month, day))?;
-                            return date.into_py_any(py);
-                        }
+                    if let Some(caps) = re.captures(value) {
+                        let year: i32 = caps.get(1).unwrap().as_str().parse().map_err(|_| {
+                            PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid year")
+                        })?;
+                        let month: u8 = caps.get(2).unwrap().as_str().parse().map_err(|_| {
+                            PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid month")
+                        })?;
+                        let day: u8 = caps.get(3).unwrap().as_str().parse().map_err(|_| {
+                            PyErr::new::<pyo3::exceptions::PyValueError, _>("Invalid day")
+                        })?;
+                        let date = date_class.call1((year, month, day))?;
+                        return date.into_py_any(py);
                     }
                 }
                 // If all else fails, return the original error
@@ -460,3 +455,22 @@ pub fn parse_merged_strftime_datetime(
         .join(" ");
     parse_strftime_datetime(py, merged_val.as_str(), merged_fmt.as_str())
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn test_re_flexible_ymd_dash() {
+        assert!(RE_FLEXIBLE_YMD_DASH.is_match("2024-1-5"));
+        assert!(RE_FLEXIBLE_YMD_DASH.is_match("2024-01-05"));
+        assert!(!RE_FLEXIBLE_YMD_DASH.is_match(r"2024\-1\-5")); // No escaped separators
+        assert!(!RE_FLEXIBLE_YMD_DASH.is_match("2024/1/5"));
+    }
+
+    #[test]
+    fn test_re_flexible_ymd_slash() {
+        assert!(RE_FLEXIBLE_YMD_SLASH.is_match("2024/1/5"));
+        assert!(!RE_FLEXIBLE_YMD_SLASH.is_match("2024-1-5"));
+    }
+}
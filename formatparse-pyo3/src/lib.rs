@@ -20,7 +20,7 @@ mod types;
 mod unicode_offsets;
 
 pub(crate) use pattern_cache::extract_extra_types_identity;
-use pattern_cache::get_or_create_parser;
+use pattern_cache::{get_or_create_parser, pattern_cache_clear, pattern_cache_info};
 use unicode_offsets::search_byte_range;
 
 pub use datetime::FixedTzOffset;
@@ -35,6 +35,22 @@ pub use match_rs::Match;
 
 pub use error::PatternParseMismatch;
 
+/// Reject input strings over `MAX_INPUT_LENGTH` bytes or containing a null byte.
+///
+/// The length check runs first, so oversized input is refused before it is scanned.
+/// The null-byte scan uses SIMD `memchr` over the UTF-8 bytes, since a null byte
+/// only ever appears as the single byte `0x00`.
+pub(crate) fn validate_input_string(string: &str) -> PyResult<()> {
+    formatparse_core::validate_input_length(string)
+        .map_err(pyo3::exceptions::PyValueError::new_err)?;
+    if memchr::memchr(0, string.as_bytes()).is_some() {
+        return Err(pyo3::exceptions::PyValueError::new_err(
+            "Input string contains null byte",
+        ));
+    }
+    Ok(())
+}
+
 /// Parse a string using a format specification
 #[pyfunction]
 #[pyo3(signature = (pattern, string, extra_types=None, case_sensitive=false, evaluate_result=true))]
@@ -45,16 +61,7 @@ fn parse(
     case_sensitive: bool,
     evaluate_result: bool,
 ) -> PyResult<Option<Py<PyAny>>> {
-    // Validate input lengths
-    formatparse_core::validate_input_length(string)
-        .map_err(pyo3::exceptions::PyValueError::new_err)?;
-
-    // Check for null bytes in inputs
-    if string.contains('\0') {
-        return Err(pyo3::exceptions::PyValueError::new_err(
-            "Input string contains null byte",
-        ));
-    }
+    validate_input_string(string)?;
 
     // Use cached parser if available
     let extra_types_cloned = Python::attach(|py| -> Option<HashMap<String, Py<PyAny>>> {
@@ -98,13 +105,7 @@ fn parse_batch(
     evaluate_result: bool,
 ) -> PyResult<Py<PyAny>> {
     for s in &strings {
-        formatparse_core::validate_input_length(s)
-            .map_err(pyo3::exceptions::PyValueError::new_err)?;
-        if s.contains('\0') {
-            return Err(pyo3::exceptions::PyValueError::new_err(
-                "Input string contains null byte",
-            ));
-        }
+        validate_input_string(s)?;
     }
 
     let extra_types_cloned = Python::attach(|py| -> Option<HashMap<String, Py<PyAny>>> {
@@ -128,8 +129,7 @@ fn parse_batch(
                     for _ in 0..strings.len() {
                         out.push(none_obj.clone_ref(py));
                     }
-                    let items: Vec<_> = out.iter().map(|o| o.bind(py)).collect();
-                    return PyList::new(py, items)?.into_py_any(py);
+                    return PyList::new(py, out)?.into_py_any(py);
                 }
                 Err(e)
             });
@@ -144,8 +144,7 @@ fn parse_batch(
                 None => out.push(py.None().into_py_any(py)?),
             }
         }
-        let items: Vec<_> = out.iter().map(|o| o.bind(py)).collect();
-        PyList::new(py, items)?.into_py_any(py)
+        PyList::new(py, out)?.into_py_any(py)
     })
 }
 
@@ -166,16 +165,7 @@ fn search(
         return Ok(None);
     };
 
-    // Validate input lengths
-    formatparse_core::validate_input_length(string)
-        .map_err(pyo3::exceptions::PyValueError::new_err)?;
-
-    // Check for null bytes in inputs
-    if string.contains('\0') {
-        return Err(pyo3::exceptions::PyValueError::new_err(
-            "Input string contains null byte",
-        ));
-    }
+    validate_input_string(string)?;
 
     let extra_types_cloned = Python::attach(|py| -> Option<HashMap<String, Py<PyAny>>> {
         extra_types.as_ref().map(|et| {
@@ -190,21 +180,25 @@ fn search(
     if let Some(result) =
         parser.search_pattern(search_string, case_sensitive, extra_types, evaluate_result)?
     {
+        // In an ASCII string byte offsets are character indices, so a search from the start
+        // needs no span adjustment at all.
+        let ascii = string.is_ascii();
+        if ascii && byte_start == 0 {
+            return Ok(Some(result));
+        }
         // Adjust byte spans to absolute offsets, then expose character indices to Python.
         Python::attach(|py| {
             if let Ok(parse_result) = result.bind(py).cast::<ParseResult>() {
-                let result_value = parse_result.borrow();
-                let adjusted = result_value
-                    .clone()
-                    .with_offset(byte_start)
-                    .spans_as_char_indices(string);
+                let mut adjusted = parse_result.borrow().clone().with_offset(byte_start);
+                if !ascii {
+                    adjusted = adjusted.spans_as_char_indices(string);
+                }
                 Ok(Some(Py::new(py, adjusted)?.into_py_any(py)?))
             } else if let Ok(match_obj) = result.bind(py).cast::<crate::match_rs::Match>() {
-                let adjusted = match_obj
-                    .borrow()
-                    .clone()
-                    .with_offset(byte_start)
-                    .spans_as_char_indices(string);
+                let mut adjusted = match_obj.borrow().clone().with_offset(byte_start);
+                if !ascii {
+                    adjusted = adjusted.spans_as_char_indices(string);
+                }
                 Ok(Some(Py::new(py, adjusted)?.into_py_any(py)?))
             } else {
                 Ok(Some(result))
@@ -219,6 +213,7 @@ fn search(
 #[pyfunction]
 #[pyo3(signature = (pattern, string, extra_types=None, case_sensitive=false, evaluate_result=true, max_matches=None))]
 fn findall(
+    py: Python<'_>,
     pattern: &str,
     string: &str,
     extra_types: Option<HashMap<String, Py<PyAny>>>,
@@ -226,26 +221,16 @@ fn findall(
     evaluate_result: bool,
     max_matches: Option<usize>,
 ) -> PyResult<Py<PyAny>> {
-    // Validate input lengths
-    formatparse_core::validate_input_length(string)
-        .map_err(pyo3::exceptions::PyValueError::new_err)?;
-
-    // Check for null bytes in inputs
-    if string.contains('\0') {
-        return Err(pyo3::exceptions::PyValueError::new_err(
-            "Input string contains null byte",
-        ));
-    }
+    validate_input_string(string)?;
 
-    let extra_types_cloned = Python::attach(|py| -> Option<HashMap<String, Py<PyAny>>> {
-        extra_types.as_ref().map(|et| {
-            et.iter()
-                .map(|(k, v)| (k.clone(), v.clone_ref(py)))
-                .collect()
-        })
+    let extra_types_cloned = extra_types.as_ref().map(|et| {
+        et.iter()
+            .map(|(k, v)| (k.clone(), v.clone_ref(py)))
+            .collect()
     });
     let parser = get_or_create_parser(pattern, extra_types_cloned)?;
     crate::parser::findall_engine::findall_matches(
+        py,
         parser,
         string,
         extra_types.as_ref(),
@@ -269,14 +254,7 @@ fn findall_iter(
     evaluate_result: bool,
     max_matches: Option<usize>,
 ) -> PyResult<Py<FindallIter>> {
-    formatparse_core::validate_input_length(string)
-        .map_err(pyo3::exceptions::PyValueError::new_err)?;
-
-    if string.contains('\0') {
-        return Err(pyo3::exceptions::PyValueError::new_err(
-            "Input string contains null byte",
-        ));
-    }
+    validate_input_string(string)?;
 
     let extra_types_cloned = Python::attach(|py| -> Option<HashMap<String, Py<PyAny>>> {
         extra_types.as_ref().map(|et| {
@@ -333,6 +311,18 @@ fn compile(
     Ok((*arc).clone())
 }
 
+/// ``(hits, misses, maxsize, currsize)`` for the shared compiled-parser LRU cache.
+#[pyfunction]
+fn cache_info() -> PyResult<(u64, u64, usize, usize)> {
+    pattern_cache_info()
+}
+
+/// Empty the shared compiled-parser LRU cache and reset its counters.
+#[pyfunction]
+fn cache_clear() -> PyResult<()> {
+    pattern_cache_clear()
+}
+
 /// Extract format specification components from a format string
 #[pyfunction]
 #[pyo3(signature = (format_string, _match_dict=None))]
@@ -462,6 +452,8 @@ fn _formatparse(py: Python<'_>, m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_function(wrap_pyfunction!(findall_iter, m)?)?;
     m.add_function(wrap_pyfunction!(compile, m)?)?;
     m.add_function(wrap_pyfunction!(extract_format, m)?)?;
+    m.add_function(wrap_pyfunction!(cache_info, m)?)?;
+    m.add_function(wrap_pyfunction!(cache_clear, m)?)?;
     m.add_class::<ParseResult>()?;
     m.add_class::<FormatParser>()?;
     m.add_class::<Format>()?;
@@ -3,6 +3,8 @@
 //! This module contains the core parsing logic, organized into sub-modules:
 //! - `pattern`: Parses format strings into field specifications
 //! - `regex`: Builds regex patterns from field specifications
+//! - `literal_prefilter`: Rejects haystacks missing a required literal before matching
+//! - `literal_int_scan`: Regex-free findall for `literal{name:d}` patterns
 //! - `matching`: Executes regex matches and extracts values
 //! - `format_parser`: Main FormatParser struct and Format class
 
@@ -12,6 +14,8 @@ pub mod findall_engine;
 pub mod findall_iter;
 pub mod format_parser;
 pub mod format_parser_pymethods;
+pub(crate) mod literal_int_scan;
+pub(crate) mod literal_prefilter;
 pub mod matching;
 pub mod raw_match;
 
@@ -4,7 +4,9 @@ use crate::parser::format_parser::FormatParser;
 use crate::parser::matching::{
     match_with_captures, match_with_captures_raw, CapturedMatchContext, FieldCaptureSlices,
 };
+use crate::parser::raw_match::RawMatchData;
 use crate::results::Results;
+use crate::types::conversion::resolve_field_converters;
 use formatparse_core::FieldType;
 use pyo3::prelude::*;
 use pyo3::types::PyList;
@@ -12,8 +14,70 @@ use pyo3::IntoPyObjectExt;
 use std::collections::HashMap;
 use std::sync::Arc;
 
+/// Raw (no Python objects) scan for the `Results` fast path.
+///
+/// Touches only Rust data, so callers run it with the GIL released. `Ok(None)` means a
+/// match needs Python conversion and the caller must rescan on the Python path.
+fn scan_raw_matches(
+    parser: &FormatParser,
+    string: &str,
+    case_sensitive: bool,
+    max_matches: Option<usize>,
+) -> PyResult<Option<Vec<RawMatchData>>> {
+    if let Some(scanner) = &parser.literal_int_scan {
+        if let Some(found) = scanner.scan(
+            &parser.fields.field_specs[0],
+            string,
+            case_sensitive,
+            max_matches,
+        ) {
+            return Ok(Some(found));
+        }
+    }
+    let at_limit = |count: usize| max_matches.map(|m| count >= m).unwrap_or(false);
+    let mut raw_results = Vec::new();
+    let search_regex = parser.get_search_regex(case_sensitive);
+    let mut last_end = 0;
+    let fields = FieldCaptureSlices::from_parser(parser);
+
+    for cap_result in search_regex.captures_iter(string) {
+        if at_limit(raw_results.len()) {
+            break;
+        }
+        let captures = cap_result.map_err(crate::error::fancy_regex_match_error)?;
+        let Some(full_match) = captures.get(0) else {
+            return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                "regex match missing capture group 0",
+            ));
+        };
+        let match_start = full_match.start();
+        let match_end = full_match.end();
+
+        if match_start < last_end {
+            continue;
+        }
+
+        match match_with_captures_raw(&captures, string, match_start, &fields) {
+            Ok(Some(raw_data)) => {
+                raw_results.push(raw_data);
+                last_end = match_end;
+                if match_start == match_end {
+                    last_end += 1;
+                }
+            }
+            Ok(None) => {}
+            Err(_) => return Ok(None),
+        }
+    }
+    Ok(Some(raw_results))
+}
+
 /// Find all non-overlapping matches; returns `Results` or a `list` of matches.
+///
+/// On the `Results` fast path the regex scan runs with the GIL released, so findall
+/// calls from several threads proceed in parallel.
 pub(crate) fn findall_matches(
+    py: Python<'_>,
     parser: Arc<FormatParser>,
     string: &str,
     extra_types: Option<&HashMap<String, Py<PyAny>>>,
@@ -33,98 +97,72 @@ pub(crate) fn findall_matches(
         .iter()
         .any(|s| matches!(s.field_type, FieldType::Nested));
 
-    if !has_custom_converters && evaluate_result && !has_nested_dicts && !has_nested_format_fields {
-        let mut raw_results = Vec::new();
-        let search_regex = parser.get_search_regex(case_sensitive);
-        let mut last_end = 0;
-        let mut raw_path_failed = false;
-        let fields = FieldCaptureSlices::from_parser(&parser);
-
-        for cap_result in search_regex.captures_iter(string) {
-            if at_limit(raw_results.len()) {
-                break;
-            }
-            let captures = cap_result.map_err(crate::error::fancy_regex_match_error)?;
-            let Some(full_match) = captures.get(0) else {
-                return Err(pyo3::exceptions::PyRuntimeError::new_err(
-                    "regex match missing capture group 0",
-                ));
-            };
-            let match_start = full_match.start();
-            let match_end = full_match.end();
-
-            if match_start < last_end {
-                continue;
-            }
+    let fast_path =
+        !has_custom_converters && evaluate_result && !has_nested_dicts && !has_nested_format_fields;
 
-            match match_with_captures_raw(&captures, string, match_start, &fields) {
-                Ok(Some(raw_data)) => {
-                    raw_results.push(raw_data);
-                    last_end = match_end;
-                    if match_start == match_end {
-                        last_end += 1;
-                    }
-                }
-                Ok(None) => {}
-                Err(_) => {
-                    raw_path_failed = true;
-                    break;
-                }
-            }
-        }
+    if !parser.may_match(string, case_sensitive) {
+        return if fast_path {
+            Py::new(py, Results::new(Vec::new()))?.into_py_any(py)
+        } else {
+            Ok(PyList::empty(py).into_any().unbind())
+        };
+    }
 
-        if !raw_path_failed {
-            return Python::attach(|py| -> PyResult<Py<PyAny>> {
-                let results = Results::new(raw_results);
-                Py::new(py, results)?.into_py_any(py)
-            });
+    if fast_path {
+        let raw_results =
+            py.detach(|| scan_raw_matches(&parser, string, case_sensitive, max_matches))?;
+        if let Some(raw_results) = raw_results {
+            return Py::new(py, Results::new(raw_results))?.into_py_any(py);
         }
     }
 
-    Python::attach(|py| -> PyResult<Py<PyAny>> {
-        let search_regex = parser.get_search_regex(case_sensitive);
-        let mut results = Vec::new();
-        let mut last_end = 0;
-        let empty_extra_types = HashMap::new();
-        let extra_types_for_matching = extra_types.unwrap_or(&empty_extra_types);
+    let search_regex = parser.get_search_regex(case_sensitive);
+    let mut results = Vec::new();
+    let mut last_end = 0;
+    let empty_extra_types = HashMap::new();
+    let extra_types_for_matching = extra_types.unwrap_or(&empty_extra_types);
+    // Look each field's converter up once for the whole scan, not once per match.
+    let field_converters =
+        resolve_field_converters(py, &parser.fields.field_specs, extra_types_for_matching);
 
-        for cap_result in search_regex.captures_iter(string) {
-            if at_limit(results.len()) {
-                break;
-            }
-            let captures = cap_result.map_err(crate::error::fancy_regex_match_error)?;
-            let Some(full_match) = captures.get(0) else {
-                return Err(pyo3::exceptions::PyRuntimeError::new_err(
-                    "regex match missing capture group 0",
-                ));
-            };
-            let match_start = full_match.start();
-            let match_end = full_match.end();
+    for cap_result in search_regex.captures_iter(string) {
+        if at_limit(results.len()) {
+            break;
+        }
+        let captures = cap_result.map_err(crate::error::fancy_regex_match_error)?;
+        let Some(full_match) = captures.get(0) else {
+            return Err(pyo3::exceptions::PyRuntimeError::new_err(
+                "regex match missing capture group 0",
+            ));
+        };
+        let match_start = full_match.start();
+        let match_end = full_match.end();
 
-            if match_start < last_end {
-                continue;
-            }
+        if match_start < last_end {
+            continue;
+        }
 
-            if let Some(result) = match_with_captures(
-                &captures,
-                &CapturedMatchContext {
-                    pattern: &parser.pattern,
-                    fields: FieldCaptureSlices::from_parser(&parser),
-                    py,
-                    custom_converters: extra_types_for_matching,
-                    evaluate_result,
-                },
-            )? {
-                results.push(result);
-                last_end = match_end;
-                if match_start == match_end {
-                    last_end += 1;
-                }
+        if let Some(result) = match_with_captures(
+            &captures,
+            &CapturedMatchContext {
+                pattern: &parser.pattern,
+                fields: FieldCaptureSlices::from_parser(&parser),
+                py,
+                custom_converters: extra_types_for_matching,
+                field_converters: &field_converters,
+                evaluate_result,
+            },
+        )? {
+            results.push(result);
+            last_end = match_end;
+            if match_start == match_end {
+                last_end += 1;
             }
         }
+    }
 
-        let items: Vec<_> = results.iter().map(|obj| obj.bind(py)).collect();
-        let results_list = PyList::new(py, items)?;
-        Ok(results_list.into())
-    })
+    // Hand the owned results straight to the list instead of borrowing each into a
+    // second Vec first.
+    let results_list = PyList::new(py, results)?;
+    Ok(results_list.into())
 }
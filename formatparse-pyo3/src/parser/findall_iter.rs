@@ -1,5 +1,6 @@
 use crate::parser::format_parser::FormatParser;
 use crate::parser::matching::{match_with_captures, match_with_captures_raw, CapturedMatchContext};
+use crate::types::conversion::resolve_field_converters;
 use formatparse_core::FieldType;
 use pyo3::prelude::*;
 use pyo3::IntoPyObjectExt;
@@ -21,6 +22,8 @@ pub struct FindallIter {
     evaluate_result: bool,
     fast_path: bool,
     extra_types: HashMap<String, Py<PyAny>>,
+    /// `extra_types` resolved per field once, rather than on every match.
+    field_converters: Vec<Option<Py<PyAny>>>,
     max_matches: Option<usize>,
     matches_emitted: usize,
     last_end: usize,
@@ -47,6 +50,16 @@ impl FindallIter {
             && evaluate_result
             && !has_nested_dicts
             && !has_nested_format_fields;
+        // Start past the end when the required literal is absent: the first
+        // `__next__` then stops without running the regex.
+        let search_pos = if parser.may_match(&haystack, case_sensitive) {
+            0
+        } else {
+            haystack.len() + 1
+        };
+        let field_converters = Python::attach(|py| {
+            resolve_field_converters(py, &parser.fields.field_specs, &extra_types)
+        });
         Self {
             parser,
             haystack,
@@ -54,10 +67,11 @@ impl FindallIter {
             evaluate_result,
             fast_path,
             extra_types,
+            field_converters,
             max_matches,
             matches_emitted: 0,
             last_end: 0,
-            search_pos: 0,
+            search_pos,
         }
     }
 
@@ -113,7 +127,7 @@ impl FindallIter {
                         }
                         slf.search_pos = slf.last_end;
                         slf.matches_emitted += 1;
-                        let pr = raw_data.to_parse_result(py)?;
+                        let pr = raw_data.into_parse_result(py)?;
                         return Ok(Some(pr.into_py_any(py)?));
                     }
                     Ok(None) => {
@@ -160,6 +174,7 @@ impl FindallIter {
                 fields: slf.parser.fields.capture_slices(),
                 py,
                 custom_converters: &slf.extra_types,
+                field_converters: &slf.field_converters,
                 evaluate_result: slf.evaluate_result,
             };
 
@@ -1,3 +1,5 @@
+use crate::parser::literal_int_scan::{is_plain_decimal, LiteralIntScan};
+use crate::parser::literal_prefilter::LiteralPrefilter;
 use crate::parser::matching::FieldCaptureSlices;
 use crate::result::ParseResult;
 use fancy_regex::Regex;
@@ -6,10 +8,15 @@ use formatparse_core::parser::MAX_FIELDS;
 use formatparse_core::{FieldSpec, FieldType};
 use pyo3::exceptions::PyValueError;
 use pyo3::prelude::*;
+use pyo3::IntoPyObjectExt;
 use std::collections::HashMap;
 use std::sync::Arc;
 
 /// Field layout produced at pattern-compile time (narrow interface for matchers).
+///
+/// One column per property, indexed by field: the per-match loops read the small
+/// `capture_geometry` / `strftime_merge_leader` / flag columns instead of recomputing
+/// them from `field_specs` on every match.
 pub(crate) struct CompiledFields {
     pub field_specs: Vec<FieldSpec>,
     pub field_names: Vec<Option<String>>,
@@ -17,6 +24,10 @@ pub(crate) struct CompiledFields {
     pub custom_type_groups: Vec<usize>,
     pub has_nested_dict_fields: Vec<bool>,
     pub nested_parsers: Vec<Option<Arc<FormatParser>>>,
+    /// `(capture_index, group_offset)` per field (see `capture_geometry_from_groups`).
+    pub capture_geometry: Vec<(usize, usize)>,
+    /// Merge leader per strftime field sharing a flat name (issue #4).
+    pub strftime_merge_leader: Vec<Option<usize>>,
     pub field_count: usize,
 }
 
@@ -29,10 +40,53 @@ impl CompiledFields {
             custom_type_groups: &self.custom_type_groups,
             has_nested_dict_fields: &self.has_nested_dict_fields,
             nested_parsers: &self.nested_parsers,
+            capture_geometry: &self.capture_geometry,
+            strftime_merge_leader: &self.strftime_merge_leader,
         }
     }
 }
 
+/// Field name when the whole pattern is one plain `{name:d}` field: no literal text, width,
+/// fill, sign, or lookaround. For such patterns an input of optionally signed decimal digits
+/// is always a full match, so [`FormatParser::parse_internal`] converts it without the regex.
+fn single_decimal_field_name(
+    pattern: &str,
+    field_specs: &[FieldSpec],
+    field_names: &[Option<String>],
+) -> Option<String> {
+    let one_field = pattern.starts_with('{')
+        && pattern.ends_with('}')
+        && pattern.matches('{').count() == 1
+        && pattern.matches('}').count() == 1;
+    let [spec] = field_specs else {
+        return None;
+    };
+    let plain_decimal = is_plain_decimal(spec) && spec.original_type_char == Some('d');
+    if !one_field || !plain_decimal {
+        return None;
+    }
+    field_names
+        .first()?
+        .as_ref()
+        .filter(|name| !name.contains('['))
+        .cloned()
+}
+
+/// `ParseResult` for a whole-input `{name:d}` match (see [`single_decimal_field_name`]).
+fn single_int_result(
+    py: Python<'_>,
+    name: &str,
+    value: i64,
+    len: usize,
+) -> PyResult<Option<Py<PyAny>>> {
+    let mut named = crate::result::pooled_named_map(1);
+    named.insert(name.to_string(), value.into_py_any(py)?);
+    let mut field_spans = crate::result::pooled_span_map(1);
+    field_spans.insert(name.to_string(), (0, len));
+    let result = ParseResult::new_with_spans(Vec::new(), named, (0, len), field_spans);
+    Ok(Some(Py::new(py, result)?.into_any()))
+}
+
 #[pyclass(module = "_formatparse", from_py_object)]
 /// Compiled format pattern for parsing strings.
 ///
@@ -60,6 +114,9 @@ pub struct FormatParser {
     pub(crate) name_mapping: std::collections::HashMap<String, String>, // Map normalized -> original
     pub(crate) stored_extra_types: Option<HashMap<String, Py<PyAny>>>, // Store extra_types for use during conversion
     pub(crate) allows_empty_default_string_match: bool, // True iff parse("") can use empty-field fast path (issue #16)
+    pub(crate) literal_prefilter: Option<LiteralPrefilter>, // Required literal scanned for before matching
+    pub(crate) single_int_name: Option<String>, // Set when the pattern is exactly `{name:d}`
+    pub(crate) literal_int_scan: Option<LiteralIntScan>, // Regex-free findall for `literal{name:d}`
 }
 
 impl FormatParser {
@@ -199,6 +256,13 @@ impl FormatParser {
             .map(|name_opt| name_opt.as_ref().map(|n| n.contains('[')).unwrap_or(false))
             .collect();
 
+        let capture_geometry = crate::parser::matching::capture_geometry_from_groups(
+            &field_specs,
+            &custom_type_groups,
+        );
+        let strftime_merge_leader =
+            crate::parser::matching::strftime_merge_leader_per_field(&field_specs, &field_names);
+
         // Build regex with DOTALL flag
         let regex = formatparse_core::build_regex(&regex_str_with_anchors)
             .map_err(crate::error::core_error_to_py_err)?;
@@ -217,9 +281,32 @@ impl FormatParser {
         let search_regex_case_insensitive =
             formatparse_core::build_search_regex(regex_search_anchored.as_str(), false).ok();
 
+        let literal_prefilter = LiteralPrefilter::new(&pattern_owned);
+        let (single_int_name, literal_int_scan) =
+            if extra_types.as_ref().is_none_or(|et| et.is_empty()) {
+                (
+                    single_decimal_field_name(&pattern_owned, &field_specs, &field_names),
+                    LiteralIntScan::new(&pattern_owned, &field_specs, &field_names),
+                )
+            } else {
+                (None, None)
+            };
+
+        // Flat names become `named` dict keys; nested `a[b]` paths are split at match time.
+        Python::attach(|py| {
+            crate::result::intern_field_names(
+                py,
+                field_names
+                    .iter()
+                    .flatten()
+                    .filter(|name| !name.contains('['))
+                    .map(String::as_str),
+            )
+        });
+
         let field_count = field_specs.len();
         Ok(Self {
-            pattern: pattern_owned,
+            pattern: pattern_owned.into_owned(),
             regex,
             regex_str,
             regex_case_insensitive,
@@ -232,11 +319,16 @@ impl FormatParser {
                 custom_type_groups,
                 has_nested_dict_fields,
                 nested_parsers,
+                capture_geometry,
+                strftime_merge_leader,
                 field_count,
             },
             name_mapping,
             stored_extra_types: extra_types,
             allows_empty_default_string_match,
+            literal_prefilter,
+            single_int_name,
+            literal_int_scan,
         })
     }
 
@@ -247,6 +339,9 @@ impl FormatParser {
         extra_types: Option<HashMap<String, Py<PyAny>>>,
         evaluate_result: bool,
     ) -> PyResult<Option<Py<PyAny>>> {
+        if !self.may_match(string, case_sensitive) {
+            return Ok(None);
+        }
         // Use pre-compiled search regex
         let search_regex = if case_sensitive {
             &self.search_regex
@@ -277,6 +372,9 @@ impl FormatParser {
                         field_names: &f.field_names,
                         normalized_names: &f.normalized_names,
                         nested_parsers: &f.nested_parsers,
+                        strftime_merge_leader: &f.strftime_merge_leader,
+                        custom_type_groups: &f.custom_type_groups,
+                        capture_geometry: &f.capture_geometry,
                         py,
                         custom_converters: extra_types_ref,
                         evaluate_result,
@@ -294,6 +392,16 @@ impl FormatParser {
         extra_types: Option<&HashMap<String, Py<PyAny>>>,
         evaluate_result: bool,
     ) -> PyResult<Option<Py<PyAny>>> {
+        if !self.may_match_whole(string, case_sensitive) {
+            return Ok(None);
+        }
+        if let Some(name) = &self.single_int_name {
+            if evaluate_result && extra_types.is_none_or(|et| et.is_empty()) {
+                if let Some(n) = crate::types::builtin_convert::parse_decimal_swar(string) {
+                    return Python::attach(|py| single_int_result(py, name, n, string.len()));
+                }
+            }
+        }
         Python::attach(|py| {
             let empty = HashMap::<String, Py<PyAny>>::new();
             let extra_types_ref = extra_types.unwrap_or(&empty);
@@ -332,6 +440,9 @@ impl FormatParser {
                     field_names: &f.field_names,
                     normalized_names: &f.normalized_names,
                     nested_parsers: &f.nested_parsers,
+                    strftime_merge_leader: &f.strftime_merge_leader,
+                    custom_type_groups: &f.custom_type_groups,
+                    capture_geometry: &f.capture_geometry,
                     py,
                     custom_converters: extra_types_ref,
                     evaluate_result,
@@ -340,6 +451,20 @@ impl FormatParser {
         })
     }
 
+    /// False when `haystack` lacks a literal every match needs (see [`LiteralPrefilter`]).
+    pub(crate) fn may_match(&self, haystack: &str, case_sensitive: bool) -> bool {
+        self.literal_prefilter
+            .as_ref()
+            .is_none_or(|p| p.may_match(haystack, case_sensitive))
+    }
+
+    /// [`Self::may_match`] for a full-string match, also checking leading / trailing literals.
+    pub(crate) fn may_match_whole(&self, haystack: &str, case_sensitive: bool) -> bool {
+        self.literal_prefilter
+            .as_ref()
+            .is_none_or(|p| p.may_match_whole(haystack, case_sensitive))
+    }
+
     /// Get the search regex for a given case sensitivity
     pub(crate) fn get_search_regex(&self, case_sensitive: bool) -> &Regex {
         if case_sensitive {
@@ -395,6 +520,8 @@ impl Clone for FormatParser {
                 custom_type_groups: self.fields.custom_type_groups.clone(),
                 has_nested_dict_fields: self.fields.has_nested_dict_fields.clone(),
                 nested_parsers: self.fields.nested_parsers.clone(),
+                capture_geometry: self.fields.capture_geometry.clone(),
+                strftime_merge_leader: self.fields.strftime_merge_leader.clone(),
                 field_count: self.fields.field_count,
             },
             name_mapping: self.name_mapping.clone(),
@@ -404,6 +531,9 @@ impl Clone for FormatParser {
                     .collect()
             }),
             allows_empty_default_string_match: self.allows_empty_default_string_match,
+            literal_prefilter: self.literal_prefilter.clone(),
+            single_int_name: self.single_int_name.clone(),
+            literal_int_scan: self.literal_int_scan.clone(),
         })
     }
 }
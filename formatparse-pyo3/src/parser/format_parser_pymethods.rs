@@ -4,14 +4,17 @@ use crate::parser::format_parser::{CompiledFields, FormatParser};
 use crate::pattern_cache::get_or_create_parser;
 use fancy_regex::Regex;
 use formatparse_core::count_capturing_groups;
-use formatparse_core::parser::validate_input_length;
 use formatparse_core::{FieldSpec, FieldType};
-use pyo3::exceptions::PyValueError;
+use once_cell::sync::Lazy;
 use pyo3::prelude::*;
 use pyo3::types::{PyAnyMethods, PyDict, PyList, PyString, PyTuple};
 use pyo3::IntoPyObjectExt;
 use std::collections::HashMap;
 
+/// Placeholder regex for the instance `__new__` builds before `__setstate__` runs.
+static UNPICKLE_PLACEHOLDER_REGEX: Lazy<Regex> =
+    Lazy::new(|| Regex::new("^$").expect("placeholder regex"));
+
 fn merge_call_extra_types(
     py: Python<'_>,
     stored: &Option<HashMap<String, Py<PyAny>>>,
@@ -64,6 +67,23 @@ fn field_type_validation_tag(spec: &FieldSpec) -> String {
     }
 }
 
+impl FormatParser {
+    /// True when the pattern cache would hand back a parser equivalent to `self`.
+    ///
+    /// That holds when no converters are in play and `self.pattern` has no backslash
+    /// line continuation left for `prepare_compiled_pattern` to fold. Hot loops over a
+    /// compiled parser then match on `self` directly instead of rehashing the pattern
+    /// and taking the cache mutex on every call.
+    fn can_skip_cache_lookup(
+        &self,
+        merged_extra_types: &Option<HashMap<String, Py<PyAny>>>,
+    ) -> bool {
+        merged_extra_types.as_ref().is_none_or(|m| m.is_empty())
+            && !self.pattern.contains("\\\n")
+            && !self.pattern.contains("\\\r")
+    }
+}
+
 #[pymethods]
 impl FormatParser {
     #[new]
@@ -77,8 +97,7 @@ impl FormatParser {
             None => {
                 // Create a dummy instance for unpickling - __setstate__ will initialize it properly
                 // We need to create a valid but minimal instance
-                let empty_regex =
-                    Regex::new("^$").map_err(|e| crate::error::regex_error(&e.to_string()))?;
+                let empty_regex = UNPICKLE_PLACEHOLDER_REGEX.clone();
                 Ok(Self {
                     pattern: String::new(),
                     regex: empty_regex.clone(),
@@ -93,11 +112,16 @@ impl FormatParser {
                         custom_type_groups: Vec::new(),
                         has_nested_dict_fields: Vec::new(),
                         nested_parsers: Vec::new(),
+                        capture_geometry: Vec::new(),
+                        strftime_merge_leader: Vec::new(),
                         field_count: 0,
                     },
                     name_mapping: HashMap::new(),
                     stored_extra_types: None,
                     allows_empty_default_string_match: false,
+                    literal_prefilter: None,
+                    single_int_name: None,
+                    literal_int_scan: None,
                 })
             }
         }
@@ -115,15 +139,17 @@ impl FormatParser {
         extra_types: Option<HashMap<String, Py<PyAny>>>,
         evaluate_result: bool,
     ) -> PyResult<Option<Py<PyAny>>> {
-        // Validate input length
-        validate_input_length(string).map_err(PyValueError::new_err)?;
-
-        // Check for null bytes
-        if string.contains('\0') {
-            return Err(PyValueError::new_err("Input string contains null byte"));
-        }
+        crate::validate_input_string(string)?;
         let merged_extra_types =
             Python::attach(|py| merge_call_extra_types(py, &self.stored_extra_types, extra_types))?;
+        if self.can_skip_cache_lookup(&merged_extra_types) {
+            return self.parse_internal(
+                string,
+                case_sensitive,
+                merged_extra_types.as_ref(),
+                evaluate_result,
+            );
+        }
         let parser = Python::attach(|py| -> PyResult<std::sync::Arc<FormatParser>> {
             let cache_et = merged_extra_types.as_ref().map(|m| {
                 m.iter()
@@ -251,16 +277,18 @@ impl FormatParser {
         extra_types: Option<HashMap<String, Py<PyAny>>>,
         evaluate_result: bool,
     ) -> PyResult<Option<Py<PyAny>>> {
-        // Validate input length
-        validate_input_length(string).map_err(PyValueError::new_err)?;
-
-        // Check for null bytes
-        if string.contains('\0') {
-            return Err(PyValueError::new_err("Input string contains null byte"));
-        }
+        crate::validate_input_string(string)?;
 
         let merged_extra_types =
             Python::attach(|py| merge_call_extra_types(py, &self.stored_extra_types, extra_types))?;
+        if self.can_skip_cache_lookup(&merged_extra_types) {
+            return self.search_pattern(
+                string,
+                case_sensitive,
+                merged_extra_types,
+                evaluate_result,
+            );
+        }
         let parser = Python::attach(|py| -> PyResult<std::sync::Arc<FormatParser>> {
             let cache_et = merged_extra_types.as_ref().map(|m| {
                 m.iter()
@@ -288,11 +316,7 @@ impl FormatParser {
         evaluate_result: bool,
         max_matches: Option<usize>,
     ) -> PyResult<Py<FindallIter>> {
-        validate_input_length(string).map_err(PyValueError::new_err)?;
-
-        if string.contains('\0') {
-            return Err(PyValueError::new_err("Input string contains null byte"));
-        }
+        crate::validate_input_string(string)?;
 
         let merged_extra_types =
             Python::attach(|py| merge_call_extra_types(py, &self.stored_extra_types, extra_types))?;
@@ -365,6 +389,9 @@ impl FormatParser {
         self.name_mapping = reconstructed.name_mapping;
         self.stored_extra_types = reconstructed.stored_extra_types;
         self.allows_empty_default_string_match = reconstructed.allows_empty_default_string_match;
+        self.literal_prefilter = reconstructed.literal_prefilter;
+        self.single_int_name = reconstructed.single_int_name;
+        self.literal_int_scan = reconstructed.literal_int_scan;
         Ok(())
     }
 }
@@ -0,0 +1,221 @@
+//! Regex-free findall scan for `literal{name:d}` patterns.
+
+use crate::parser::literal_prefilter::find_ascii_caseless;
+use crate::parser::raw_match::{convert_value_raw, RawMatchData};
+use formatparse_core::{FieldSpec, FieldType};
+use memchr::memmem::Finder;
+
+/// A `d` / `i` field with no width, precision, fill, alignment, sign, or lookaround.
+///
+/// Its regex is `[+-]?(?:0[xX][0-9a-fA-F]+|0[oO][0-7]+|0[bB][01]+|[ \t]*[0-9]+)`.
+pub(crate) fn is_plain_decimal(spec: &FieldSpec) -> bool {
+    matches!(spec.field_type, FieldType::Integer)
+        && matches!(spec.original_type_char, Some('d') | Some('i'))
+        && spec.width.is_none()
+        && spec.precision.is_none()
+        && spec.alignment.is_none()
+        && spec.sign.is_none()
+        && spec.fill.is_none()
+        && !spec.zero_pad
+        && spec.regex_lookbehind.is_none()
+        && spec.regex_lookahead.is_none()
+}
+
+/// Scanner for a pattern that is a literal followed by one plain decimal field.
+///
+/// Candidates are found with a `memmem` search for the literal, and the field is matched by
+/// walking bytes with the same alternation order as its regex, so findall over such patterns
+/// never enters the regex engine.
+#[derive(Clone, Debug)]
+pub(crate) struct LiteralIntScan {
+    literal: Box<[u8]>,
+    finder: Finder<'static>,
+    /// The literal has no ASCII letters, so `(?i)` cannot change what it matches.
+    caseless: bool,
+    /// `None` for a positional `{:d}` field.
+    name: Option<String>,
+}
+
+impl LiteralIntScan {
+    /// `Some` when `pattern` is exactly `literal{field}` with a non-empty literal that does not
+    /// end in whitespace (trailing whitespace compiles to a flexible `\s+`), no brace escapes,
+    /// and a field accepted by [`is_plain_decimal`].
+    pub(crate) fn new(
+        pattern: &str,
+        field_specs: &[FieldSpec],
+        field_names: &[Option<String>],
+    ) -> Option<Self> {
+        let [spec] = field_specs else {
+            return None;
+        };
+        if !is_plain_decimal(spec)
+            || pattern.matches('{').count() != 1
+            || pattern.matches('}').count() != 1
+            || !pattern.ends_with('}')
+        {
+            return None;
+        }
+        let literal = &pattern[..pattern.find('{')?];
+        if literal.is_empty() || literal.trim_end() != literal {
+            return None;
+        }
+        let name = field_names.first()?.clone();
+        if name.as_deref().is_some_and(|n| n.contains('[')) {
+            return None;
+        }
+        Some(Self {
+            literal: literal.as_bytes().into(),
+            finder: Finder::new(literal.as_bytes()).into_owned(),
+            caseless: literal
+                .bytes()
+                .all(|b| b.is_ascii() && !b.is_ascii_alphabetic()),
+            name,
+        })
+    }
+
+    /// All non-overlapping matches, as the regex scan would report them.
+    ///
+    /// `None` means the caller must use the regex scan: a case-insensitive scan needs an ASCII
+    /// literal and haystack (Unicode case folding could otherwise match other characters), and
+    /// a value that does not convert natively needs the Python path.
+    pub(crate) fn scan(
+        &self,
+        field_spec: &FieldSpec,
+        haystack: &str,
+        case_sensitive: bool,
+        max_matches: Option<usize>,
+    ) -> Option<Vec<RawMatchData>> {
+        let fold_case = !case_sensitive && !self.caseless;
+        if fold_case && !(self.literal.is_ascii() && haystack.is_ascii()) {
+            return None;
+        }
+        let bytes = haystack.as_bytes();
+        let mut results = Vec::new();
+        let mut pos = 0;
+        while max_matches.is_none_or(|m| results.len() < m) {
+            let Some(start) = self.find_literal(bytes, pos, fold_case) else {
+                break;
+            };
+            let field_start = start + self.literal.len();
+            let Some(field_end) = decimal_field_end(bytes, field_start) else {
+                // The regex would retry the literal one byte further on.
+                pos = start + 1;
+                continue;
+            };
+            let value = convert_value_raw(field_spec, &haystack[field_start..field_end]).ok()?;
+            let mut raw = RawMatchData::with_capacity(1);
+            raw.span = (start, field_end);
+            match &self.name {
+                Some(name) => {
+                    raw.named.insert(name.clone(), value);
+                    raw.field_spans
+                        .insert(name.clone(), (field_start, field_end));
+                }
+                None => raw.fixed.push(value),
+            }
+            results.push(raw);
+            pos = field_end;
+        }
+        Some(results)
+    }
+
+    fn find_literal(&self, bytes: &[u8], pos: usize, fold_case: bool) -> Option<usize> {
+        let rest = bytes.get(pos..)?;
+        if !fold_case {
+            return self.finder.find(rest).map(|at| pos + at);
+        }
+        find_ascii_caseless(rest, &self.literal).map(|at| pos + at)
+    }
+}
+
+/// End of the plain decimal field regex match starting at `at`, trying the alternatives in
+/// regex order; `None` when it does not match there.
+fn decimal_field_end(bytes: &[u8], at: usize) -> Option<usize> {
+    fn run(bytes: &[u8], from: usize, accept: impl Fn(u8) -> bool) -> usize {
+        from + bytes[from..].iter().take_while(|&&b| accept(b)).count()
+    }
+    let mut i = at;
+    if matches!(bytes.get(i), Some(b'+' | b'-')) {
+        i += 1;
+    }
+    if bytes.get(i) == Some(&b'0') {
+        let prefixed_end = match bytes.get(i + 1) {
+            Some(b'x' | b'X') => run(bytes, i + 2, |b| b.is_ascii_hexdigit()),
+            Some(b'o' | b'O') => run(bytes, i + 2, |b| matches!(b, b'0'..=b'7')),
+            Some(b'b' | b'B') => run(bytes, i + 2, |b| matches!(b, b'0' | b'1')),
+            _ => i + 2,
+        };
+        if prefixed_end > i + 2 {
+            return Some(prefixed_end);
+        }
+    }
+    let digits_start = run(bytes, i, |b| b == b' ' || b == b'\t');
+    let end = run(bytes, digits_start, |b| b.is_ascii_digit());
+    (end > digits_start).then_some(end)
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    fn spec() -> FieldSpec {
+        FieldSpec {
+            field_type: FieldType::Integer,
+            original_type_char: Some('d'),
+            ..Default::default()
+        }
+    }
+
+    fn scanner(pattern: &str) -> Option<LiteralIntScan> {
+        LiteralIntScan::new(pattern, &[spec()], &[Some("id".to_string())])
+    }
+
+    fn spans(pattern: &str, haystack: &str, case_sensitive: bool) -> Vec<(usize, usize)> {
+        scanner(pattern)
+            .unwrap()
+            .scan(&spec(), haystack, case_sensitive, None)
+            .unwrap()
+            .iter()
+            .map(|m| m.span)
+            .collect()
+    }
+
+    #[test]
+    fn only_literal_then_field_shapes() {
+        assert!(scanner("ID:{id:d}").is_some());
+        assert!(scanner("{id:d}").is_none());
+        assert!(scanner("ID: {id:d}").is_none());
+        assert!(scanner("ID:{id:d};").is_none());
+        assert!(scanner("{{ID:{id:d}").is_none());
+    }
+
+    #[test]
+    fn field_follows_regex_alternation_order() {
+        assert_eq!(decimal_field_end(b"42x", 0), Some(2));
+        assert_eq!(decimal_field_end(b"-7", 0), Some(2));
+        assert_eq!(decimal_field_end(b"0x1Fg", 0), Some(4));
+        assert_eq!(decimal_field_end(b"0xg", 0), Some(1));
+        assert_eq!(decimal_field_end(b"0b102", 0), Some(4));
+        assert_eq!(decimal_field_end(b" \t5", 0), Some(3));
+        assert_eq!(decimal_field_end(b"+x", 0), None);
+        assert_eq!(decimal_field_end(b"", 0), None);
+    }
+
+    #[test]
+    fn finds_non_overlapping_matches() {
+        assert_eq!(
+            spans("ID:{id:d}", "ID:1 ID:x ID:22", true),
+            vec![(0, 4), (10, 15)]
+        );
+        assert_eq!(spans("aa{id:d}", "aaa1", true), vec![(1, 4)]);
+        assert_eq!(spans("ID:{id:d}", "id:1 Id:2", false), vec![(0, 4), (5, 9)]);
+        assert!(spans("ID:{id:d}", "id:1", true).is_empty());
+    }
+
+    #[test]
+    fn non_ascii_haystack_falls_back_when_folding_case() {
+        let s = scanner("ID:{id:d}").unwrap();
+        assert!(s.scan(&spec(), "ID:1 \u{212a}", false).is_none());
+        assert!(s.scan(&spec(), "ID:1 \u{212a}", true).is_some());
+    }
+}
@@ -0,0 +1,268 @@
+//! Substring prefilter run before the regex engine (parse, search, findall).
+
+use memchr::memmem::Finder;
+
+/// The literal runs every match must contain, with a precompiled `memmem` searcher for the
+/// longest one.
+///
+/// `memchr` picks an AVX2 / SSE2 / NEON scan at runtime, so a haystack that lacks the
+/// literal is rejected at memory bandwidth without entering the regex engine. When the
+/// pattern has several runs, they are stored back to back in one buffer and checked in
+/// pattern order after the longest one is found.
+#[derive(Clone, Debug)]
+pub(crate) struct LiteralPrefilter {
+    finder: Finder<'static>,
+    /// The longest literal is ASCII with no letters, so `(?i)` matching cannot change it.
+    caseless: bool,
+    /// All runs concatenated; `run_spans` holds `(start, len)` into it, in pattern order.
+    /// Empty when the pattern has a single run.
+    run_bytes: Box<[u8]>,
+    run_spans: Box<[(u32, u32)]>,
+    /// Total byte length of all runs: no case-sensitive match is shorter.
+    min_len: usize,
+    /// Total char count of all runs: under `(?i)` a literal char may match a shorter
+    /// encoding (`K` U+212A matches `k`), but never less than one byte.
+    min_len_caseless: usize,
+    /// Literal a full match starts / ends with (see `formatparse_core::literal_affixes`);
+    /// empty when the pattern begins / ends with a field.
+    prefix: Box<str>,
+    suffix: Box<str>,
+    /// Per affix: it also holds under `(?i)` (same rule as `caseless`).
+    prefix_caseless: bool,
+    suffix_caseless: bool,
+}
+
+/// ASCII with no letters, so `(?i)` matching cannot change it.
+fn is_caseless(literal: &str) -> bool {
+    literal
+        .bytes()
+        .all(|b| b.is_ascii() && !b.is_ascii_alphabetic())
+}
+
+/// First position of `needle` in `haystack` under ASCII case folding.
+///
+/// For an ASCII needle and an ASCII haystack this is exactly what `(?i)` matches: the
+/// Unicode-only folds (`K` U+212A, `ſ` U+017F) need a non-ASCII byte on one side.
+pub(crate) fn find_ascii_caseless(haystack: &[u8], needle: &[u8]) -> Option<usize> {
+    let Some((&first, rest)) = needle.split_first() else {
+        return Some(0);
+    };
+    let mut from = 0;
+    while let Some(at) = memchr::memchr2(
+        first.to_ascii_lowercase(),
+        first.to_ascii_uppercase(),
+        &haystack[from..],
+    ) {
+        let cand = from + at;
+        if haystack
+            .get(cand + 1..cand + needle.len())
+            .is_some_and(|w| w.eq_ignore_ascii_case(rest))
+        {
+            return Some(cand);
+        }
+        from = cand + 1;
+    }
+    None
+}
+
+/// False only when `bytes` provably cannot match the ASCII `affix` under `(?i)`.
+///
+/// Bytes are compared pairwise (from the end when `from_end`) up to the first non-ASCII
+/// haystack byte, where a Unicode fold could make one character span several bytes.
+fn affix_may_match_caseless(bytes: &[u8], affix: &str, from_end: bool) -> bool {
+    if !affix.is_ascii() {
+        return true;
+    }
+    let affix = affix.as_bytes();
+    for i in 0..affix.len().min(bytes.len()) {
+        let (b, a) = if from_end {
+            (bytes[bytes.len() - 1 - i], affix[affix.len() - 1 - i])
+        } else {
+            (bytes[i], affix[i])
+        };
+        if !b.is_ascii() {
+            return true;
+        }
+        if !b.eq_ignore_ascii_case(&a) {
+            return false;
+        }
+    }
+    bytes.len() >= affix.len()
+}
+
+impl LiteralPrefilter {
+    /// Build from a normalized pattern; `None` when the pattern has no literal text.
+    pub(crate) fn new(pattern: &str) -> Option<Self> {
+        let runs = formatparse_core::required_literals(pattern);
+        let (prefix, suffix) = formatparse_core::literal_affixes(pattern);
+        let literal = runs
+            .iter()
+            .fold(None, |best: Option<&String>, run| match best {
+                Some(b) if b.len() >= run.len() => Some(b),
+                _ => Some(run),
+            })?;
+        let caseless = is_caseless(literal);
+        let (run_bytes, run_spans) = if runs.len() > 1 {
+            let mut bytes = Vec::with_capacity(runs.iter().map(String::len).sum());
+            let mut spans = Vec::with_capacity(runs.len());
+            for run in &runs {
+                spans.push((bytes.len() as u32, run.len() as u32));
+                bytes.extend_from_slice(run.as_bytes());
+            }
+            (bytes.into_boxed_slice(), spans.into_boxed_slice())
+        } else {
+            (Box::default(), Box::default())
+        };
+        Some(Self {
+            finder: Finder::new(literal.as_bytes()).into_owned(),
+            caseless,
+            run_bytes,
+            run_spans,
+            min_len: runs.iter().map(String::len).sum(),
+            min_len_caseless: runs.iter().map(|run| run.chars().count()).sum(),
+            prefix_caseless: prefix.as_deref().is_some_and(is_caseless),
+            suffix_caseless: suffix.as_deref().is_some_and(is_caseless),
+            prefix: prefix.unwrap_or_default().into_boxed_str(),
+            suffix: suffix.unwrap_or_default().into_boxed_str(),
+        })
+    }
+
+    /// False only when `haystack` cannot contain a match.
+    ///
+    /// A haystack shorter than the runs combined is rejected first. Case-insensitive
+    /// matching checks only the longest literal: directly when it is caseless, with an
+    /// ASCII case-folding byte search when it and the haystack are ASCII, and not at all
+    /// otherwise.
+    pub(crate) fn may_match(&self, haystack: &str, case_sensitive: bool) -> bool {
+        let min_len = if case_sensitive {
+            self.min_len
+        } else {
+            self.min_len_caseless
+        };
+        if haystack.len() < min_len {
+            return false;
+        }
+        let bytes = haystack.as_bytes();
+        if case_sensitive {
+            return self.finder.find(bytes).is_some() && self.runs_in_order(bytes);
+        }
+        if self.caseless {
+            return self.finder.find(bytes).is_some();
+        }
+        let literal = self.finder.needle();
+        if literal.is_ascii() && haystack.is_ascii() {
+            return find_ascii_caseless(bytes, literal).is_some();
+        }
+        true
+    }
+
+    /// Like [`Self::may_match`], for a match that must span all of `haystack` (`parse`).
+    ///
+    /// A leading or trailing literal is then a `starts_with` / `ends_with` comparison (an
+    /// ASCII case-folding one under `(?i)`), so input with the wrong head or tail is
+    /// rejected without scanning the rest of it.
+    pub(crate) fn may_match_whole(&self, haystack: &str, case_sensitive: bool) -> bool {
+        let bytes = haystack.as_bytes();
+        let prefix_ok = self.prefix.is_empty()
+            || if case_sensitive || self.prefix_caseless {
+                haystack.starts_with(&*self.prefix)
+            } else {
+                affix_may_match_caseless(bytes, &self.prefix, false)
+            };
+        let suffix_ok = self.suffix.is_empty()
+            || if case_sensitive || self.suffix_caseless {
+                haystack.ends_with(&*self.suffix)
+            } else {
+                affix_may_match_caseless(bytes, &self.suffix, true)
+            };
+        prefix_ok && suffix_ok && self.may_match(haystack, case_sensitive)
+    }
+
+    /// Every run occurs in `haystack`, each after the end of the previous one.
+    fn runs_in_order(&self, haystack: &[u8]) -> bool {
+        let mut pos = 0;
+        for &(start, len) in self.run_spans.iter() {
+            let run = &self.run_bytes[start as usize..(start + len) as usize];
+            match memchr::memmem::find(&haystack[pos..], run) {
+                Some(at) => pos += at + run.len(),
+                None => return false,
+            }
+        }
+        true
+    }
+}
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn rejects_haystack_without_literal() {
+        let p = LiteralPrefilter::new("ID:{id:d}").unwrap();
+        assert!(p.may_match("x ID:7 y", true));
+        assert!(!p.may_match("x id 7 y", true));
+        // "ID:" has letters: case-insensitive matching folds ASCII case on ASCII input...
+        assert!(p.may_match("x id:7 y", false));
+        assert!(!p.may_match("x id 7 y", false));
+        // ...and leaves non-ASCII input, where U+212A folds to `k`, to the regex.
+        assert!(p.may_match("x id 7 \u{212a}", false));
+    }
+
+    #[test]
+    fn ascii_caseless_search() {
+        assert_eq!(find_ascii_caseless(b"xx iD:1", b"ID:"), Some(3));
+        assert_eq!(find_ascii_caseless(b"i id:", b"ID:"), Some(2));
+        assert_eq!(find_ascii_caseless(b"ID", b"ID:"), None);
+        assert_eq!(find_ascii_caseless(b"ID:", b""), Some(0));
+    }
+
+    #[test]
+    fn caseless_literal_applies_to_case_insensitive_matching() {
+        let p = LiteralPrefilter::new("{name}: {age:d}").unwrap();
+        assert!(!p.may_match("Alice 30", false));
+        assert!(p.may_match("Alice: 30", false));
+    }
+
+    #[test]
+    fn checks_every_run_in_order() {
+        let p = LiteralPrefilter::new("Value: {v:d}, Count: {c:d}").unwrap();
+        assert!(p.may_match("Value: 1, Count: 2", true));
+        assert!(!p.may_match("Value: 1; Count: 2", true));
+        assert!(!p.may_match(", Count: 2 Value: 1", true));
+    }
+
+    #[test]
+    fn rejects_haystack_shorter_than_literals() {
+        let p = LiteralPrefilter::new("<{}> and <{}>").unwrap();
+        assert!(!p.may_match("<> and", true));
+        assert!(!p.may_match("<> and", false));
+        assert!(p.may_match("<> and <>", true));
+        // One char per literal char is the caseless lower bound.
+        let p = LiteralPrefilter::new("\u{212a}{}").unwrap();
+        assert!(p.may_match("k", false));
+        assert!(!p.may_match("k", true));
+    }
+
+    #[test]
+    fn whole_match_checks_leading_and_trailing_literals() {
+        let p = LiteralPrefilter::new("Start: {data} End").unwrap();
+        assert!(p.may_match_whole("Start: x End", true));
+        assert!(!p.may_match_whole("xStart: x End", true));
+        assert!(!p.may_match_whole("Start: x Endx", true));
+        // Affixes with letters are compared with ASCII case folding under `(?i)`...
+        assert!(p.may_match_whole("start: x end", false));
+        assert!(!p.may_match_whole("stop: x end", false));
+        assert!(!p.may_match_whole("start: x ends", false));
+        // ...up to the first non-ASCII byte, which could be a Unicode fold.
+        assert!(p.may_match_whole("\u{17f}tart: x end", false));
+        assert!(!p.may_match_whole("st", false));
+        let p = LiteralPrefilter::new("<{}>").unwrap();
+        assert!(!p.may_match_whole("<x> ", false));
+        assert!(p.may_match("<x> ", false));
+    }
+
+    #[test]
+    fn none_without_literal() {
+        assert!(LiteralPrefilter::new("{}{}").is_none());
+    }
+}
@@ -1,10 +1,7 @@
 use fancy_regex::Captures;
-use formatparse_core::{count_capturing_groups, FieldSpec, FieldType};
-use pyo3::prelude::*;
+use formatparse_core::{FieldSpec, FieldType};
 use std::collections::HashMap;
 
-use super::custom_type::validate_custom_type_pattern;
-
 pub fn extract_capture<'a>(
     captures: &'a Captures<'a>,
     field_index: usize,
@@ -32,39 +29,23 @@ pub fn extract_capture<'a>(
 }
 
 /// For each field index, `(actual_capture_index, group_offset)` at the start of
-/// processing that field, matching the main match loops' bookkeeping.
-pub(crate) fn per_field_capture_geometry(
+/// processing that field, matching the main match loops' bookkeeping, from the per-field
+/// group counts computed at compile time.
+pub(crate) fn capture_geometry_from_groups(
     field_specs: &[FieldSpec],
-    _normalized_names: &[Option<String>],
-    py: Python<'_>,
-    custom_converters: &HashMap<String, Py<PyAny>>,
-    precomputed_pattern_groups: Option<&[usize]>,
-) -> PyResult<Vec<(usize, usize)>> {
+    pattern_groups: &[usize],
+) -> Vec<(usize, usize)> {
     let mut go = 0usize;
     let mut out = Vec::with_capacity(field_specs.len());
     for (i, spec) in field_specs.iter().enumerate() {
-        let pattern_groups = if let Some(pc) = precomputed_pattern_groups {
-            pc.get(i).copied().unwrap_or(0)
-        } else if matches!(spec.field_type, FieldType::Nested) {
-            spec.nested_regex_body
-                .as_ref()
-                .map(|b| count_capturing_groups(b))
-                .unwrap_or(0)
-        } else if !custom_converters.is_empty() {
-            validate_custom_type_pattern(spec, custom_converters, py)?
-        } else {
-            0
-        };
         // Capture group 0 is the full match, so field capture indices start at 1.
         out.push((i + 1, go));
         if spec.alignment.is_some() {
             go += 1;
         }
-        if pattern_groups > 0 {
-            go += pattern_groups;
-        }
+        go += pattern_groups.get(i).copied().unwrap_or(0);
     }
-    Ok(out)
+    out
 }
 
 /// `entry[i] == Some(L)` when field `i` merges with others under the same flat name `L`
@@ -102,3 +83,23 @@ pub(crate) fn strftime_merge_leader_per_field(
     }
     out
 }
+
+#[cfg(test)]
+mod tests {
+    use super::capture_geometry_from_groups;
+    use formatparse_core::FieldSpec;
+
+    #[test]
+    fn geometry_accounts_for_alignment_and_custom_groups() {
+        let plain = FieldSpec::default();
+        let aligned = FieldSpec {
+            alignment: Some('<'),
+            ..Default::default()
+        };
+        let specs = [plain.clone(), aligned, plain];
+        assert_eq!(
+            capture_geometry_from_groups(&specs, &[2, 0, 0]),
+            vec![(1, 0), (2, 2), (3, 3)]
+        );
+    }
+}
@@ -24,6 +24,8 @@ pub struct FieldCaptureSlices<'a> {
     pub custom_type_groups: &'a [usize],
     pub has_nested_dict_fields: &'a [bool],
     pub nested_parsers: &'a [Option<Arc<FormatParser>>],
+    pub capture_geometry: &'a [(usize, usize)],
+    pub strftime_merge_leader: &'a [Option<usize>],
 }
 
 impl<'a> FieldCaptureSlices<'a> {
@@ -38,6 +40,9 @@ pub struct CapturedMatchContext<'a> {
     pub fields: FieldCaptureSlices<'a>,
     pub py: Python<'a>,
     pub custom_converters: &'a HashMap<String, Py<PyAny>>,
+    /// `custom_converters` resolved per field once per scan (see
+    /// `conversion::resolve_field_converters`); empty when there are none.
+    pub field_converters: &'a [Option<Py<PyAny>>],
     pub evaluate_result: bool,
 }
 
@@ -49,6 +54,12 @@ pub struct RegexMatchContext<'a> {
     pub field_names: &'a [Option<String>],
     pub normalized_names: &'a [Option<String>],
     pub nested_parsers: &'a [Option<Arc<FormatParser>>],
+    /// Precompiled strftime merge leaders (see `CompiledFields::strftime_merge_leader`).
+    pub strftime_merge_leader: &'a [Option<usize>],
+    /// Capturing groups inside each field's fragment, validated when the parser was
+    /// compiled with these converters (see `CompiledFields::custom_type_groups`).
+    pub custom_type_groups: &'a [usize],
+    pub capture_geometry: &'a [(usize, usize)],
     pub py: Python<'a>,
     pub custom_converters: &'a HashMap<String, Py<PyAny>>,
     pub evaluate_result: bool,
@@ -60,6 +71,7 @@ mod nested_dict;
 mod py_match;
 mod raw;
 
+pub(crate) use capture::{capture_geometry_from_groups, strftime_merge_leader_per_field};
 pub use custom_type::validate_custom_type_pattern;
 pub use nested_dict::insert_nested_dict;
 pub use py_match::{match_empty_default_string_parse, match_with_captures, match_with_regex};
@@ -1,7 +1,7 @@
 use crate::match_rs::{Match, MatchInit};
 use crate::result::ParseResult;
 use fancy_regex::{Captures, Regex};
-use formatparse_core::{count_capturing_groups, FieldSpec, FieldType};
+use formatparse_core::{FieldSpec, FieldType};
 use pyo3::prelude::*;
 use pyo3::IntoPyObjectExt;
 use std::collections::HashMap;
@@ -9,8 +9,8 @@ use std::collections::HashMap;
 use super::custom_type::validate_custom_type_pattern;
 use super::nested_dict::{get_nested_dict_value, insert_nested_dict};
 use super::{
-    capture::{extract_capture, per_field_capture_geometry, strftime_merge_leader_per_field},
-    capture_string_for_match_storage, CapturedMatchContext, RegexMatchContext,
+    capture::extract_capture, capture_string_for_match_storage, CapturedMatchContext,
+    RegexMatchContext,
 };
 
 fn py_objects_equal(py: Python<'_>, a: &Py<PyAny>, b: &Py<PyAny>) -> PyResult<bool> {
@@ -37,24 +37,20 @@ pub fn match_with_captures(
     let start = full_match.start(); // Already absolute position in full string
     let end = full_match.end(); // Already absolute position in full string
 
-    let strftime_merge_leader = strftime_merge_leader_per_field(field_specs, field_names);
-    let capture_geom = per_field_capture_geometry(
-        field_specs,
-        normalized_names,
-        py,
-        custom_converters,
-        Some(custom_type_groups),
-    )?;
+    let strftime_merge_leader = ctx.fields.strftime_merge_leader;
+    let capture_geom = ctx.fields.capture_geometry;
 
     // Pre-allocate with capacity based on expected field count
     let field_count = field_specs.len();
     // Fast path: for single-field patterns, use optimized allocation
     let mut fixed = Vec::with_capacity(field_count);
-    let mut named: HashMap<String, Py<PyAny>> = HashMap::with_capacity(field_count.max(1));
-    let mut field_spans: HashMap<String, (usize, usize)> =
-        HashMap::with_capacity(field_count.max(1));
-    let mut captures_vec = Vec::with_capacity(field_count); // For Match object when evaluate_result=False
-    let mut named_captures = HashMap::with_capacity(field_count); // For Match object when evaluate_result=False
+    let mut named = crate::result::pooled_named_map(field_count.max(1));
+    let mut field_spans = crate::result::pooled_span_map(field_count.max(1));
+    // Raw captures are only kept for the Match object (evaluate_result=False); a zero
+    // capacity does not allocate, so the evaluated path skips this scratch entirely.
+    let match_capacity = if evaluate_result { 0 } else { field_count };
+    let mut captures_vec = Vec::with_capacity(match_capacity);
+    let mut named_captures = HashMap::with_capacity(match_capacity);
     let mut group_offset = 0;
     // Track the actual capture group index (accounts for both named and unnamed groups)
     let mut actual_capture_index = 1; // Start at 1 (group 0 is full match)
@@ -190,11 +186,11 @@ pub fn match_with_captures(
                             None => return Ok(None),
                         }
                     } else {
-                        crate::types::conversion::convert_value(
+                        crate::types::conversion::convert_value_with(
                             spec,
                             value_str,
                             py,
-                            custom_converters,
+                            ctx.field_converters.get(i).and_then(Option::as_ref),
                         )?
                     };
 
@@ -298,10 +294,11 @@ pub fn match_with_regex(regex: &Regex, ctx: &RegexMatchContext<'_>) -> PyResult<
         // Pre-allocate with capacity based on expected field count
         let field_count = field_specs.len();
         let mut fixed = Vec::with_capacity(field_count);
-        let mut named: HashMap<String, Py<PyAny>> = HashMap::with_capacity(field_count);
-        let mut field_spans: HashMap<String, (usize, usize)> = HashMap::with_capacity(field_count);
-        let mut captures_vec = Vec::with_capacity(field_count); // For Match object when evaluate_result=False
-        let mut named_captures = HashMap::with_capacity(field_count); // For Match object when evaluate_result=False
+        let mut named = crate::result::pooled_named_map(field_count);
+        let mut field_spans = crate::result::pooled_span_map(field_count);
+        let match_capacity = if evaluate_result { 0 } else { field_count };
+        let mut captures_vec = Vec::with_capacity(match_capacity); // For Match object when evaluate_result=False
+        let mut named_captures = HashMap::with_capacity(match_capacity); // For Match object when evaluate_result=False
 
         let full_match = captures.get(0).ok_or_else(|| {
             pyo3::exceptions::PyRuntimeError::new_err("regex match missing capture group 0")
@@ -309,9 +306,9 @@ pub fn match_with_regex(regex: &Regex, ctx: &RegexMatchContext<'_>) -> PyResult<
         let start = full_match.start();
         let end = full_match.end();
 
-        let strftime_merge_leader = strftime_merge_leader_per_field(field_specs, field_names);
-        let capture_geom =
-            per_field_capture_geometry(field_specs, normalized_names, py, custom_converters, None)?;
+        // Merge leaders and capture geometry come precompiled with the parser.
+        let strftime_merge_leader = ctx.strftime_merge_leader;
+        let capture_geom = ctx.capture_geometry;
 
         let mut fixed_index = 0;
         let mut group_offset = 0;
@@ -320,16 +317,7 @@ pub fn match_with_regex(regex: &Regex, ctx: &RegexMatchContext<'_>) -> PyResult<
 
         for (i, spec) in field_specs.iter().enumerate() {
             // Capturing groups inside this field's regex fragment (custom converters or nested).
-            let pattern_groups = if matches!(spec.field_type, FieldType::Nested) {
-                spec.nested_regex_body
-                    .as_ref()
-                    .map(|b| count_capturing_groups(b))
-                    .unwrap_or(0)
-            } else if !custom_converters.is_empty() {
-                validate_custom_type_pattern(spec, custom_converters, py)?
-            } else {
-                0
-            };
+            let pattern_groups = ctx.custom_type_groups.get(i).copied().unwrap_or(0);
 
             // Extract capture group
             let cap = extract_capture(
@@ -1,6 +1,7 @@
 use crate::parser::raw_match::{RawMatchData, RawValue};
 use fancy_regex::Captures;
 use formatparse_core::FieldType;
+use std::collections::hash_map::Entry;
 
 use super::capture::extract_capture;
 use super::FieldCaptureSlices;
@@ -14,7 +15,7 @@ pub fn match_with_captures_raw(
     let field_specs = fields.field_specs;
     let field_names = fields.field_names;
     let normalized_names = fields.normalized_names;
-    let custom_type_groups = fields.custom_type_groups;
+    let capture_geometry = fields.capture_geometry;
     let has_nested_dict_fields = fields.has_nested_dict_fields;
 
     let full_match = captures
@@ -27,17 +28,20 @@ pub fn match_with_captures_raw(
     let mut raw_data = RawMatchData::with_capacity(field_count);
     raw_data.span = (start, end);
 
-    let mut group_offset = 0;
-
     for (i, spec) in field_specs.iter().enumerate() {
-        let pattern_groups = custom_type_groups.get(i).copied().unwrap_or(0);
-
         if matches!(spec.field_type, FieldType::Nested) {
             return Err("Nested format fields require Python conversion".to_string());
         }
 
-        // Capture group 0 is the full match, so field capture indices start at 1.
-        let cap = extract_capture(captures, i, normalized_names, spec, i + 1, group_offset);
+        let (capture_index, group_offset) = capture_geometry[i];
+        let cap = extract_capture(
+            captures,
+            i,
+            normalized_names,
+            spec,
+            capture_index,
+            group_offset,
+        );
 
         if let Some(cap) = cap {
             let value_str = cap.as_str();
@@ -58,14 +62,17 @@ pub fn match_with_captures_raw(
                             // Nested dict fields require Python conversion (complex dict structure)
                             return Err("Nested dict fields require Python conversion".to_string());
                         } else {
-                            // Regular flat field name
-                            if let Some(existing) = raw_data.named.get(original_name) {
-                                // Check if values match (for repeated names)
-                                if !values_equal(existing, &raw_value) {
-                                    return Ok(None); // Values don't match
+                            // Regular flat field name; one hash lookup per field per match
+                            match raw_data.named.entry(original_name.clone()) {
+                                Entry::Occupied(existing) => {
+                                    // Check if values match (for repeated names)
+                                    if !values_equal(existing.get(), &raw_value) {
+                                        return Ok(None); // Values don't match
+                                    }
+                                }
+                                Entry::Vacant(slot) => {
+                                    slot.insert(raw_value);
                                 }
-                            } else {
-                                raw_data.named.insert(original_name.clone(), raw_value);
                             }
                         }
                         raw_data
@@ -81,13 +88,6 @@ pub fn match_with_captures_raw(
                 }
             }
         }
-
-        if spec.alignment.is_some() {
-            group_offset += 1;
-        }
-        if pattern_groups > 0 {
-            group_offset += pattern_groups;
-        }
     }
 
     Ok(Some(raw_data))
@@ -82,13 +82,36 @@ impl RawMatchData {
             .map(|v| v.to_py_object(py))
             .collect::<PyResult<_>>()?;
 
-        let mut named: HashMap<String, Py<PyAny>> = HashMap::with_capacity(self.named.len());
+        let mut named = crate::result::pooled_named_map(self.named.len());
         for (k, v) in &self.named {
             named.insert(k.clone(), v.to_py_object(py)?);
         }
+        let mut field_spans = crate::result::pooled_span_map(self.field_spans.len());
+        field_spans.extend(self.field_spans.iter().map(|(k, &span)| (k.clone(), span)));
 
-        let parse_result =
-            ParseResult::new_with_spans(fixed, named, self.span, self.field_spans.clone());
+        let parse_result = ParseResult::new_with_spans(fixed, named, self.span, field_spans);
+        Py::new(py, parse_result)
+    }
+
+    /// Like [`Self::to_parse_result`], but moves names and spans instead of cloning them.
+    ///
+    /// Used by the streaming ``findall_iter`` path, where each match is converted once.
+    pub fn into_parse_result(self, py: Python) -> PyResult<pyo3::Py<crate::result::ParseResult>> {
+        use crate::result::ParseResult;
+
+        let fixed: Vec<Py<PyAny>> = self
+            .fixed
+            .iter()
+            .map(|v| v.to_py_object(py))
+            .collect::<PyResult<_>>()?;
+
+        let mut named = crate::result::pooled_named_map(self.named.len());
+        for (k, v) in self.named {
+            let obj = v.to_py_object(py)?;
+            named.insert(k, obj);
+        }
+
+        let parse_result = ParseResult::new_with_spans(fixed, named, self.span, self.field_spans);
         Py::new(py, parse_result)
     }
 }
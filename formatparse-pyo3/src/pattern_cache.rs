@@ -9,10 +9,20 @@ use std::collections::hash_map::DefaultHasher;
 use std::collections::HashMap;
 use std::hash::{Hash, Hasher};
 use std::num::NonZeroUsize;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::{Arc, Mutex};
 
-static PATTERN_CACHE: Lazy<Mutex<LruCache<u64, Arc<FormatParser>>>> =
-    Lazy::new(|| Mutex::new(LruCache::new(NonZeroUsize::new(1000).unwrap())));
+/// Maximum number of compiled parsers kept in [`PATTERN_CACHE`].
+pub(crate) const PATTERN_CACHE_CAPACITY: usize = 1000;
+
+static PATTERN_CACHE: Lazy<Mutex<LruCache<u64, Arc<FormatParser>>>> = Lazy::new(|| {
+    Mutex::new(LruCache::new(
+        NonZeroUsize::new(PATTERN_CACHE_CAPACITY).unwrap(),
+    ))
+});
+
+static CACHE_HITS: AtomicU64 = AtomicU64::new(0);
+static CACHE_MISSES: AtomicU64 = AtomicU64::new(0);
 
 fn lock_pattern_cache(
 ) -> Result<std::sync::MutexGuard<'static, LruCache<u64, Arc<FormatParser>>>, PyErr> {
@@ -97,6 +107,7 @@ pub(crate) fn get_or_create_parser(
 
         if let Some(cached_parser) = cached {
             if cached_parser.matches_pattern_cache_request(py, &normalized, &extra_types) {
+                CACHE_HITS.fetch_add(1, Ordering::Relaxed);
                 return Ok(cached_parser);
             }
             let warnings = py.import("warnings")?;
@@ -105,6 +116,7 @@ pub(crate) fn get_or_create_parser(
             warnings.call_method1("warn", (msg,))?;
         }
 
+        CACHE_MISSES.fetch_add(1, Ordering::Relaxed);
         let parser = Arc::new(FormatParser::new_with_extra_types(
             &normalized,
             extra_types,
@@ -118,3 +130,22 @@ pub(crate) fn get_or_create_parser(
         Ok(parser)
     })
 }
+
+/// `(hits, misses, maxsize, currsize)` for the compiled-parser cache.
+pub(crate) fn pattern_cache_info() -> PyResult<(u64, u64, usize, usize)> {
+    let currsize = lock_pattern_cache()?.len();
+    Ok((
+        CACHE_HITS.load(Ordering::Relaxed),
+        CACHE_MISSES.load(Ordering::Relaxed),
+        PATTERN_CACHE_CAPACITY,
+        currsize,
+    ))
+}
+
+/// Drop every cached parser and reset the hit/miss counters.
+pub(crate) fn pattern_cache_clear() -> PyResult<()> {
+    lock_pattern_cache()?.clear();
+    CACHE_HITS.store(0, Ordering::Relaxed);
+    CACHE_MISSES.store(0, Ordering::Relaxed);
+    Ok(())
+}
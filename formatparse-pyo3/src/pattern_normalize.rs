@@ -11,9 +11,25 @@
 
 use pyo3::exceptions::PyValueError;
 use pyo3::PyResult;
+use std::borrow::Cow;
+
+/// True when `pattern` has a backslash directly before a line ending, i.e. something
+/// [`normalize_pattern_line_continuations`] could rewrite.
+fn has_line_continuation(pattern: &str) -> bool {
+    pattern
+        .as_bytes()
+        .windows(2)
+        .any(|w| w[0] == b'\\' && (w[1] == b'\n' || w[1] == b'\r'))
+}
 
 /// Fold backslash line continuations; does not validate length or null bytes.
-pub fn normalize_pattern_line_continuations(pattern: &str) -> String {
+///
+/// Patterns without a backslash before a line ending (the common case) are returned
+/// borrowed, so cache lookups do not copy the pattern on every call.
+pub fn normalize_pattern_line_continuations(pattern: &str) -> Cow<'_, str> {
+    if !has_line_continuation(pattern) {
+        return Cow::Borrowed(pattern);
+    }
     let b = pattern.as_bytes();
     let mut out = Vec::with_capacity(b.len());
     let mut i = 0usize;
@@ -60,15 +76,28 @@ pub fn normalize_pattern_line_continuations(pattern: &str) -> String {
         }
     }
     // Output is built only from valid UTF-8 slices of `pattern` plus ASCII `\` / newlines / spaces.
-    String::from_utf8(out).expect("normalize_pattern_line_continuations: UTF-8 invariant")
+    Cow::Owned(
+        String::from_utf8(out).expect("normalize_pattern_line_continuations: UTF-8 invariant"),
+    )
 }
 
-pub fn prepare_compiled_pattern(pattern: &str) -> PyResult<String> {
-    if pattern.contains('\0') {
+/// Validate and normalize a pattern before it is hashed or compiled.
+///
+/// Folding continuations only ever shortens a pattern, so the length limit is checked
+/// on the raw pattern first: one within the limit needs no second check, and an
+/// oversized one without continuations is refused before anything else scans it.
+pub fn prepare_compiled_pattern(pattern: &str) -> PyResult<Cow<'_, str>> {
+    let oversized = pattern.len() > formatparse_core::MAX_PATTERN_LENGTH;
+    if oversized && !has_line_continuation(pattern) {
+        formatparse_core::validate_pattern_length(pattern).map_err(PyValueError::new_err)?;
+    }
+    if memchr::memchr(0, pattern.as_bytes()).is_some() {
         return Err(PyValueError::new_err("Pattern contains null byte"));
     }
     let normalized = normalize_pattern_line_continuations(pattern);
-    formatparse_core::validate_pattern_length(&normalized).map_err(PyValueError::new_err)?;
+    if oversized {
+        formatparse_core::validate_pattern_length(&normalized).map_err(PyValueError::new_err)?;
+    }
     Ok(normalized)
 }
 
@@ -107,6 +136,23 @@ mod tests {
         assert_eq!(normalize_pattern_line_continuations("a\nb"), "a\nb");
     }
 
+    #[test]
+    fn pattern_without_continuation_is_borrowed() {
+        assert!(matches!(
+            normalize_pattern_line_continuations("{a}\n{b}"),
+            Cow::Borrowed("{a}\n{b}")
+        ));
+    }
+
+    #[test]
+    fn length_limit_applies_after_folding() {
+        let max = formatparse_core::MAX_PATTERN_LENGTH;
+        assert!(prepare_compiled_pattern(&"a".repeat(max)).is_ok());
+        assert!(prepare_compiled_pattern(&"a".repeat(max + 1)).is_err());
+        let folded = format!("{}\\\n{}", "a".repeat(max / 2), " ".repeat(max));
+        assert!(prepare_compiled_pattern(&folded).is_ok());
+    }
+
     #[test]
     fn empty() {
         assert_eq!(normalize_pattern_line_continuations(""), "");
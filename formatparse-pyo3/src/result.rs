@@ -1,33 +1,174 @@
 use crate::unicode_offsets::byte_to_char_index;
+use once_cell::sync::Lazy;
 use pyo3::prelude::*;
-use pyo3::types::{PySlice, PyString, PyTuple};
+use pyo3::sync::PyOnceLock;
+use pyo3::types::{PyDict, PySlice, PyString, PyTuple};
 use pyo3::IntoPyObjectExt;
+use std::cell::RefCell;
 use std::collections::HashMap;
+use std::sync::Mutex;
+use std::thread::LocalKey;
+
+/// Upper bound on [`FIELD_NAME_KEYS`] so compiling many distinct patterns cannot grow it forever.
+const MAX_INTERNED_FIELD_NAMES: usize = 4096;
+
+/// Interned Python `str` keys for field names, filled when patterns are compiled.
+///
+/// The `named` getter reuses these instead of allocating (and hashing) a fresh key per
+/// field on every access.
+static FIELD_NAME_KEYS: Lazy<Mutex<HashMap<String, Py<PyString>>>> =
+    Lazy::new(|| Mutex::new(HashMap::new()));
+
+/// Register field names seen at compile time in the shared key table.
+///
+/// Python objects are created with the table unlocked: allocation can run the garbage
+/// collector, and a finalizer reading `named` would otherwise deadlock on the mutex.
+pub(crate) fn intern_field_names<'a>(py: Python<'_>, names: impl IntoIterator<Item = &'a str>) {
+    let missing: Vec<&str> = {
+        let Ok(keys) = FIELD_NAME_KEYS.lock() else {
+            return;
+        };
+        let room = MAX_INTERNED_FIELD_NAMES.saturating_sub(keys.len());
+        names
+            .into_iter()
+            .filter(|name| !keys.contains_key(*name))
+            .take(room)
+            .collect()
+    };
+    if missing.is_empty() {
+        return;
+    }
+    let interned: Vec<(String, Py<PyString>)> = missing
+        .into_iter()
+        .map(|name| (name.to_string(), PyString::intern(py, name).unbind()))
+        .collect();
+    if let Ok(mut keys) = FIELD_NAME_KEYS.lock() {
+        for (name, key) in interned {
+            if keys.len() >= MAX_INTERNED_FIELD_NAMES {
+                break;
+            }
+            keys.entry(name).or_insert(key);
+        }
+    }
+}
+
+/// Interned key for each of `names` registered by [`intern_field_names`], in order.
+///
+/// Only references are taken under the lock; callers build their dict after it is released.
+fn interned_field_name_keys<'py, 'a>(
+    py: Python<'py>,
+    names: impl ExactSizeIterator<Item = &'a String>,
+) -> Vec<Option<Bound<'py, PyString>>> {
+    match FIELD_NAME_KEYS.lock() {
+        Ok(table) => names
+            .map(|k| table.get(k).map(|key| key.bind(py).clone()))
+            .collect(),
+        Err(_) => vec![None; names.len()],
+    }
+}
+
+/// Most emptied maps kept per thread in each of the result map pools.
+const MAX_POOLED_MAPS: usize = 16;
+
+/// Maps that grew past this capacity are freed rather than pooled.
+const MAX_POOLED_MAP_CAPACITY: usize = 64;
+
+type NamedMap = HashMap<String, Py<PyAny>>;
+type SpanMap = HashMap<String, (usize, usize)>;
+
+thread_local! {
+    /// Emptied `named` / `field_spans` tables from dropped results, reused by the next match
+    /// on the same thread so a parse loop does not allocate two hash tables per call.
+    static NAMED_MAP_POOL: RefCell<Vec<NamedMap>> = const { RefCell::new(Vec::new()) };
+    static SPAN_MAP_POOL: RefCell<Vec<SpanMap>> = const { RefCell::new(Vec::new()) };
+}
+
+fn take_pooled<V>(
+    pool: &'static LocalKey<RefCell<Vec<HashMap<String, V>>>>,
+    capacity: usize,
+) -> HashMap<String, V> {
+    let recycled = pool
+        .try_with(|pool| pool.try_borrow_mut().ok().and_then(|mut p| p.pop()))
+        .ok()
+        .flatten();
+    match recycled {
+        Some(mut map) => {
+            map.reserve(capacity);
+            map
+        }
+        None => HashMap::with_capacity(capacity),
+    }
+}
+
+fn recycle<V>(
+    pool: &'static LocalKey<RefCell<Vec<HashMap<String, V>>>>,
+    mut map: HashMap<String, V>,
+) {
+    let capacity = map.capacity();
+    if capacity == 0 || capacity > MAX_POOLED_MAP_CAPACITY {
+        return;
+    }
+    // Clear before touching the pool: dropping values can run Python finalizers that drop
+    // other results on this thread.
+    map.clear();
+    let _ = pool.try_with(|pool| {
+        if let Ok(mut p) = pool.try_borrow_mut() {
+            if p.len() < MAX_POOLED_MAPS {
+                p.push(map);
+            }
+        }
+    });
+}
+
+/// Empty `named` map with room for `capacity` fields, reused from a dropped result if possible.
+pub(crate) fn pooled_named_map(capacity: usize) -> NamedMap {
+    take_pooled(&NAMED_MAP_POOL, capacity)
+}
+
+/// Empty `field_spans` map with room for `capacity` fields, reused if possible.
+pub(crate) fn pooled_span_map(capacity: usize) -> SpanMap {
+    take_pooled(&SPAN_MAP_POOL, capacity)
+}
 
 #[pyclass(from_py_object)]
 pub struct ParseResult {
     fixed: Vec<Py<PyAny>>,
-    #[pyo3(get)]
     pub named: HashMap<String, Py<PyAny>>,
     pub span: (usize, usize),
     pub field_spans: HashMap<String, (usize, usize)>, // Maps field index/name to (start, end)
+    /// The `named` dict, built on first access and returned on every later one.
+    named_dict: PyOnceLock<Py<PyDict>>,
 }
 
 impl Clone for ParseResult {
     fn clone(&self) -> Self {
-        Python::attach(|py| Self {
-            fixed: self.fixed.iter().map(|obj| obj.clone_ref(py)).collect(),
-            named: self
-                .named
-                .iter()
-                .map(|(k, v)| (k.clone(), v.clone_ref(py)))
-                .collect(),
-            span: self.span,
-            field_spans: self.field_spans.clone(),
+        Python::attach(|py| {
+            let named_dict = PyOnceLock::new();
+            if let Some(dict) = self.named_dict.get(py) {
+                let _ = named_dict.set(py, dict.clone_ref(py));
+            }
+            Self {
+                fixed: self.fixed.iter().map(|obj| obj.clone_ref(py)).collect(),
+                named: self
+                    .named
+                    .iter()
+                    .map(|(k, v)| (k.clone(), v.clone_ref(py)))
+                    .collect(),
+                span: self.span,
+                field_spans: self.field_spans.clone(),
+                named_dict,
+            }
         })
     }
 }
 
+impl Drop for ParseResult {
+    fn drop(&mut self) {
+        recycle(&NAMED_MAP_POOL, std::mem::take(&mut self.named));
+        recycle(&SPAN_MAP_POOL, std::mem::take(&mut self.field_spans));
+    }
+}
+
 /// Truncate by Unicode scalar values so we never split inside a codepoint.
 fn repr_trunc(s: &str, max_chars: usize) -> String {
     if max_chars < 3 {
@@ -52,6 +193,7 @@ impl ParseResult {
             named,
             span,
             field_spans: HashMap::new(),
+            named_dict: PyOnceLock::new(),
         }
     }
 
@@ -66,17 +208,17 @@ impl ParseResult {
             named,
             span,
             field_spans,
+            named_dict: PyOnceLock::new(),
         }
     }
 
     pub fn with_offset(mut self, offset: usize) -> Self {
         self.span = (self.span.0 + offset, self.span.1 + offset);
-        // Adjust all field spans by offset
-        self.field_spans = self
-            .field_spans
-            .into_iter()
-            .map(|(k, (start, end))| (k, (start + offset, end + offset)))
-            .collect();
+        // Adjust all field spans by offset (in place: the map is recycled on drop)
+        for (start, end) in self.field_spans.values_mut() {
+            *start += offset;
+            *end += offset;
+        }
         self
     }
 
@@ -86,19 +228,10 @@ impl ParseResult {
             byte_to_char_index(haystack, self.span.0),
             byte_to_char_index(haystack, self.span.1),
         );
-        self.field_spans = self
-            .field_spans
-            .into_iter()
-            .map(|(k, (start, end))| {
-                (
-                    k,
-                    (
-                        byte_to_char_index(haystack, start),
-                        byte_to_char_index(haystack, end),
-                    ),
-                )
-            })
-            .collect();
+        for (start, end) in self.field_spans.values_mut() {
+            *start = byte_to_char_index(haystack, *start);
+            *end = byte_to_char_index(haystack, *end);
+        }
         self
     }
 
@@ -108,23 +241,46 @@ impl ParseResult {
         const MAX_VAL_CHARS: usize = 120;
         const MAX_FIXED: usize = 8;
 
-        let mut keys: Vec<_> = self.named.keys().cloned().collect();
-        keys.sort();
+        // Once `named` has been handed out it may have been edited and is authoritative
+        // (as in `__getitem__`); otherwise show the parsed values.
+        let mut entries: Vec<(String, Bound<'_, PyAny>, Bound<'_, PyAny>)> =
+            match self.named_dict.get(py) {
+                Some(dict) => dict
+                    .bind(py)
+                    .iter()
+                    .map(|(k, v)| -> PyResult<_> {
+                        let sort_key = match k.extract::<String>() {
+                            Ok(name) => name,
+                            Err(_) => k.repr()?.extract()?,
+                        };
+                        Ok((sort_key, k, v))
+                    })
+                    .collect::<PyResult<_>>()?,
+                None => self
+                    .named
+                    .iter()
+                    .map(|(k, v)| {
+                        (
+                            k.clone(),
+                            PyString::new(py, k).into_any(),
+                            v.bind(py).clone(),
+                        )
+                    })
+                    .collect(),
+            };
+        entries.sort_by(|a, b| a.0.cmp(&b.0));
 
         let mut named_parts = Vec::new();
-        for k in keys.iter().take(MAX_KEYS) {
-            let Some(v) = self.named.get(k) else {
-                continue;
-            };
+        for (_, k, v) in entries.iter().take(MAX_KEYS) {
             // Use Python `repr(key)` so dict-style output matches CPython (single-quoted keys),
             // not Rust `Debug` / `{:?}` which uses double quotes.
-            let key_repr: String = PyString::new(py, k.as_str()).repr()?.extract()?;
-            let r: String = v.bind(py).repr()?.extract()?;
+            let key_repr: String = k.repr()?.extract()?;
+            let r: String = v.repr()?.extract()?;
             named_parts.push(format!("{}: {}", key_repr, repr_trunc(&r, MAX_VAL_CHARS)));
         }
         let mut named_body = named_parts.join(", ");
-        if keys.len() > MAX_KEYS {
-            named_body.push_str(&format!(", ... (+{} more)", keys.len() - MAX_KEYS));
+        if entries.len() > MAX_KEYS {
+            named_body.push_str(&format!(", ... (+{} more)", entries.len() - MAX_KEYS));
         }
         let named_display = format!("{{{}}}", named_body);
 
@@ -175,6 +331,28 @@ impl ParseResult {
         })
     }
 
+    /// Named fields as a ``dict`` (keys come from the compile-time intern table).
+    ///
+    /// The dict is built on first access and the same object is returned afterwards, so
+    /// results that are never asked for ``named`` never allocate one, repeated
+    /// ``result.named[...]`` lookups do not rebuild it, and changes made to it stick (as
+    /// with ``parse.Result.named``).
+    #[getter]
+    fn named<'py>(&self, py: Python<'py>) -> PyResult<Bound<'py, PyDict>> {
+        let dict = self
+            .named_dict
+            .get_or_try_init(py, || -> PyResult<Py<PyDict>> {
+                let keys = interned_field_name_keys(py, self.named.keys());
+                let dict = PyDict::new(py);
+                for ((name, value), key) in self.named.iter().zip(keys) {
+                    let key = key.unwrap_or_else(|| PyString::new(py, name));
+                    dict.set_item(key, value.bind(py))?;
+                }
+                Ok(dict.unbind())
+            })?;
+        Ok(dict.bind(py).clone())
+    }
+
     #[getter]
     fn span(&self) -> (usize, usize) {
         self.span
@@ -224,6 +402,19 @@ impl ParseResult {
                         PyErr::new::<pyo3::exceptions::PyIndexError, _>("Index out of range")
                     })
             } else if let Ok(name) = key.extract::<String>() {
+                if let Some(dict) = self.named_dict.get(py) {
+                    // `named` was handed out and may have been changed; it is authoritative.
+                    return dict
+                        .bind(py)
+                        .get_item(key)?
+                        .map(Bound::unbind)
+                        .ok_or_else(|| {
+                            PyErr::new::<pyo3::exceptions::PyKeyError, _>(format!(
+                                "Key '{}' not found",
+                                name
+                            ))
+                        });
+                }
                 self.named
                     .get(&name)
                     .map(|obj| obj.clone_ref(py))
@@ -242,10 +433,13 @@ impl ParseResult {
     }
 
     fn __contains__(&self, key: &Bound<'_, PyAny>) -> PyResult<bool> {
-        Python::attach(|_py| {
+        Python::attach(|py| {
             if let Ok(idx) = key.extract::<usize>() {
                 Ok(idx < self.fixed.len())
             } else if let Ok(name) = key.extract::<String>() {
+                if let Some(dict) = self.named_dict.get(py) {
+                    return dict.bind(py).contains(key);
+                }
                 Ok(self.named.contains_key(&name))
             } else {
                 Ok(false)
@@ -256,10 +450,13 @@ impl ParseResult {
     #[getter]
     fn spans(&self) -> PyResult<Py<PyAny>> {
         Python::attach(|py| {
+            let keys = interned_field_name_keys(py, self.field_spans.keys());
             let dict = pyo3::types::PyDict::new(py);
-            for (key, value) in &self.field_spans {
+            for ((key, value), interned) in self.field_spans.iter().zip(keys) {
                 let py_key: Py<PyAny> = if let Ok(idx) = key.parse::<usize>() {
                     idx.into_py_any(py)?
+                } else if let Some(interned) = interned {
+                    interned.into_any().unbind()
                 } else {
                     key.clone().into_py_any(py)?
                 };
@@ -270,3 +467,29 @@ impl ParseResult {
         })
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn span_maps_are_recycled_empty() {
+        let mut map = pooled_span_map(4);
+        map.insert("a".to_string(), (0, 1));
+        let capacity = map.capacity();
+        recycle(&SPAN_MAP_POOL, map);
+        let reused = pooled_span_map(1);
+        assert!(reused.is_empty());
+        assert_eq!(reused.capacity(), capacity);
+    }
+
+    #[test]
+    fn oversized_maps_are_not_pooled() {
+        SPAN_MAP_POOL.with(|pool| pool.borrow_mut().clear());
+        recycle(
+            &SPAN_MAP_POOL,
+            HashMap::with_capacity(MAX_POOLED_MAP_CAPACITY * 4),
+        );
+        assert!(SPAN_MAP_POOL.with(|pool| pool.borrow().is_empty()));
+    }
+}
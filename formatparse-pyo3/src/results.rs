@@ -28,14 +28,12 @@ impl Results {
             return Ok(cached.clone_ref(py));
         }
 
-        let mut py_results: Vec<Py<PyAny>> = Vec::with_capacity(self.raw_data.len());
-        for raw_data in &self.raw_data {
-            let parse_result = raw_data.to_parse_result(py)?;
-            py_results.push(parse_result.into_py_any(py)?);
-        }
-
-        let items: Vec<_> = py_results.iter().map(|obj| obj.bind(py)).collect();
-        let results_list = PyList::new(py, items)?;
+        let py_results = self
+            .raw_data
+            .iter()
+            .map(|raw_data| raw_data.to_parse_result(py))
+            .collect::<PyResult<Vec<_>>>()?;
+        let results_list = PyList::new(py, py_results)?;
         let list_obj = results_list.into_py_any(py)?;
 
         // Cache the result
@@ -96,8 +94,7 @@ impl Results {
                 }
                 i += indices.step;
             }
-            let py_items: Vec<_> = items.iter().map(|obj| obj.bind(py)).collect();
-            Ok(PyList::new(py, py_items)?.into_py_any(py)?)
+            Ok(PyList::new(py, items)?.into_py_any(py)?)
         } else {
             Err(PyTypeError::new_err(
                 "list indices must be integers or slices",
@@ -149,10 +146,9 @@ impl ResultsIterator {
     fn __next__(&mut self, py: Python) -> PyResult<Option<Py<PyAny>>> {
         // On first iteration, batch convert all items at once
         if self.cached_list.is_none() {
-            let results = self.results.bind(py);
-            // Convert all items in a single batch (one GIL block)
-            let list = results.call_method0("to_list")?;
-            self.cached_list = Some(list.into_py_any(py)?);
+            // Convert all items in a single batch, without a Python-level method call
+            let list = self.results.bind(py).try_borrow_mut()?.convert_all(py)?;
+            self.cached_list = Some(list);
         }
 
         // Now iterate over the cached list (no FFI overhead)
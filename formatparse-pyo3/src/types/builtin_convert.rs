@@ -22,27 +22,116 @@ pub enum ConvertOutcome {
     Err(String),
 }
 
+/// Value of eight ASCII digits loaded little-endian (first digit in the low byte), or `None`
+/// if any byte is not `0`-`9`. SWAR: validate all lanes at once, then combine digit pairs,
+/// quads, and halves with three multiplies (the fast_float / simdjson formulation).
+#[inline]
+fn parse_eight_digits_swar(chunk: u64) -> Option<u64> {
+    const ZEROS: u64 = 0x3030_3030_3030_3030;
+    const HIGH_NIBBLES: u64 = 0xF0F0_F0F0_F0F0_F0F0;
+    let all_digits = ((chunk & HIGH_NIBBLES)
+        | ((chunk.wrapping_add(0x0606_0606_0606_0606) & HIGH_NIBBLES) >> 4))
+        == 0x3333_3333_3333_3333;
+    if !all_digits {
+        return None;
+    }
+    let mut v = chunk.wrapping_sub(ZEROS);
+    v = v.wrapping_mul(10).wrapping_add(v >> 8);
+    let pairs_lo = (v & 0x0000_00FF_0000_00FF).wrapping_mul(100 + (1_000_000 << 32));
+    let pairs_hi = ((v >> 16) & 0x0000_00FF_0000_00FF).wrapping_mul(1 + (10_000 << 32));
+    Some(pairs_lo.wrapping_add(pairs_hi) >> 32)
+}
+
+/// Load up to eight digits as the low end of a `'0'`-padded little-endian word.
+#[inline]
+fn load_padded_digits(digits: &[u8]) -> u64 {
+    let mut buf = [b'0'; 8];
+    buf[8 - digits.len()..].copy_from_slice(digits);
+    u64::from_le_bytes(buf)
+}
+
+/// Parse an optionally signed run of 1-16 ASCII decimal digits without a per-digit loop.
+///
+/// Returns `None` for anything else (whitespace, prefixes, separators, longer input) so the
+/// caller falls back to the general path; 16 digits always fit in `i64`.
+pub(crate) fn parse_decimal_swar(text: &str) -> Option<i64> {
+    let bytes = text.as_bytes();
+    let (negative, digits) = match bytes.first() {
+        Some(b'-') => (true, &bytes[1..]),
+        Some(b'+') => (false, &bytes[1..]),
+        _ => (false, bytes),
+    };
+    let magnitude = match digits.len() {
+        1..=8 => parse_eight_digits_swar(load_padded_digits(digits))?,
+        9..=16 => {
+            let split = digits.len() - 8;
+            let high = parse_eight_digits_swar(load_padded_digits(&digits[..split]))?;
+            let low = parse_eight_digits_swar(load_padded_digits(&digits[split..]))?;
+            high * 100_000_000 + low
+        }
+        _ => return None,
+    };
+    let n = magnitude as i64;
+    Some(if negative { -n } else { n })
+}
+
+/// Radix for unprefixed integer text, indexed by the ASCII presentation type (`b`, `o`,
+/// `x` / `X`); every other type is decimal. One table load instead of a compare chain per
+/// capture.
+const RADIX_BY_TYPE: [u8; 128] = {
+    let mut table = [10u8; 128];
+    table[b'b' as usize] = 2;
+    table[b'o' as usize] = 8;
+    table[b'x' as usize] = 16;
+    table[b'X' as usize] = 16;
+    table
+};
+
+#[inline]
+fn radix_for_type(type_char: Option<char>) -> u32 {
+    match type_char {
+        Some(c) if c.is_ascii() => RADIX_BY_TYPE[c as usize] as u32,
+        _ => 10,
+    }
+}
+
 /// Parse integer text using the same rules as the legacy raw/Python paths.
 pub fn parse_integer_text(spec: &FieldSpec, value: &str) -> Result<i64, String> {
-    if spec.fill.is_none() && spec.alignment != Some('=') && spec.original_type_char.is_none() {
-        if let Ok(n) = value.trim().parse::<i64>() {
-            return Ok(n);
+    // A `0` fill (`{:0>5d}`) needs no stripping: leading zeros are already valid digits, so
+    // such captures take the fast paths too. `=` keeps the general path, which strips fill
+    // after the sign.
+    if matches!(spec.fill, None | Some('0')) && spec.alignment != Some('=') {
+        match spec.original_type_char {
+            None => {
+                if let Ok(n) = value.trim().parse::<i64>() {
+                    return Ok(n);
+                }
+            }
+            // Plain decimal digits mean the same for `d` / `i` as in the general path below
+            // (no radix prefix can be spelled with digits alone).
+            Some('d') | Some('i') => {
+                if let Some(n) = parse_decimal_swar(value.trim()) {
+                    return Ok(n);
+                }
+            }
+            _ => {}
         }
     }
 
-    let mut trimmed_str = value.trim().to_string();
+    let mut trimmed_str = std::borrow::Cow::Borrowed(value.trim());
     if let (Some(fill_ch), Some('=')) = (spec.fill, spec.alignment) {
         if trimmed_str.starts_with('-') || trimmed_str.starts_with('+') {
             let sign_char = &trimmed_str[..1];
             let rest = &trimmed_str[1..];
             let rest_trimmed = rest.trim_start_matches(fill_ch);
-            trimmed_str = format!("{}{}", sign_char, rest_trimmed);
+            trimmed_str = std::borrow::Cow::Owned(format!("{}{}", sign_char, rest_trimmed));
         } else {
-            trimmed_str = trimmed_str.trim_start_matches(fill_ch).to_string();
+            trimmed_str =
+                std::borrow::Cow::Owned(trimmed_str.trim_start_matches(fill_ch).to_string());
         }
     }
 
-    let trimmed = trimmed_str.as_str();
+    let trimmed: &str = &trimmed_str;
     let (is_negative, num_str) = if let Some(rest) = trimmed.strip_prefix('-') {
         (true, rest)
     } else if let Some(rest) = trimmed.strip_prefix('+') {
@@ -70,18 +159,40 @@ pub fn parse_integer_text(spec: &FieldSpec, value: &str) -> Result<i64, String>
         };
         result.map(|n| if is_negative { -n } else { n })
     } else {
-        match spec.original_type_char {
-            Some('b') => i64::from_str_radix(num_str, 2),
-            Some('o') => i64::from_str_radix(num_str, 8),
-            Some('x') | Some('X') => i64::from_str_radix(num_str, 16),
-            _ => num_str.parse::<i64>(),
-        }
-        .map(|n| if is_negative { -n } else { n })
+        i64::from_str_radix(num_str, radix_for_type(spec.original_type_char)).map(|n| {
+            if is_negative {
+                -n
+            } else {
+                n
+            }
+        })
     };
 
     v.map_err(|_| format!("Could not convert '{}' to integer", value))
 }
 
+/// Slice of `value` that a string-typed field converts to, when no folding is needed.
+///
+/// Mirrors the `String`, character-class, and `BracedContent` arms of
+/// [`convert_builtin_scalar`] so the Python path can build a `str` straight from the input
+/// slice instead of going through an owned [`ConvertedScalar::String`]. `None` for every
+/// other type.
+pub(crate) fn borrowed_string_capture<'a>(spec: &FieldSpec, value: &'a str) -> Option<&'a str> {
+    match &spec.field_type {
+        FieldType::String => match trim_string_or_multiline_value(spec, value) {
+            std::borrow::Cow::Borrowed(t) => Some(t),
+            std::borrow::Cow::Owned(_) => None,
+        },
+        FieldType::Letters
+        | FieldType::Word
+        | FieldType::NonLetters
+        | FieldType::NonWhitespace
+        | FieldType::NonDigits
+        | FieldType::BracedContent => Some(value),
+        _ => None,
+    }
+}
+
 /// Convert captured text for builtin field types without Python callables.
 pub fn convert_builtin_scalar(spec: &FieldSpec, value: &str) -> ConvertOutcome {
     match &spec.field_type {
@@ -148,15 +259,10 @@ pub fn convert_builtin_scalar(spec: &FieldSpec, value: &str) -> ConvertOutcome {
             )),
         },
         FieldType::GeneralNumber => {
+            // `f64::from_str` already accepts `nan` / `inf` / `infinity` with an optional sign in
+            // any case, so no lowercased copy is needed to special-case them.
             let trimmed = value.trim();
-            let lower = trimmed.to_lowercase();
-            if lower == "nan" {
-                ConvertOutcome::Ok(ConvertedScalar::Float(f64::NAN))
-            } else if lower == "inf" || lower == "+inf" {
-                ConvertOutcome::Ok(ConvertedScalar::Float(f64::INFINITY))
-            } else if lower == "-inf" {
-                ConvertOutcome::Ok(ConvertedScalar::Float(f64::NEG_INFINITY))
-            } else if let Ok(n) = trimmed.parse::<i64>() {
+            if let Ok(n) = trimmed.parse::<i64>() {
                 ConvertOutcome::Ok(ConvertedScalar::Integer(n))
             } else if let Ok(n) = trimmed.parse::<f64>() {
                 ConvertOutcome::Ok(ConvertedScalar::Float(n))
@@ -212,3 +318,109 @@ impl ConvertedScalar {
         }
     }
 }
+
+#[cfg(test)]
+mod tests {
+    use super::*;
+
+    #[test]
+    fn swar_matches_std_parse() {
+        for text in [
+            "0",
+            "7",
+            "42",
+            "12345",
+            "99999999",
+            "100000000",
+            "-123456789",
+            "+0000000000000001",
+            "9999999999999999",
+            "1234567890123456",
+        ] {
+            assert_eq!(parse_decimal_swar(text), text.parse::<i64>().ok(), "{text}");
+        }
+    }
+
+    #[test]
+    fn borrowed_string_capture_trims_like_convert() {
+        let spec = FieldSpec {
+            alignment: Some('^'),
+            ..FieldSpec::new()
+        };
+        assert_eq!(borrowed_string_capture(&spec, "  hi  "), Some("hi"));
+        let spec = FieldSpec {
+            field_type: FieldType::Integer,
+            ..FieldSpec::new()
+        };
+        assert_eq!(borrowed_string_capture(&spec, "12"), None);
+    }
+
+    #[test]
+    fn general_number_accepts_special_floats() {
+        let spec = FieldSpec {
+            field_type: FieldType::GeneralNumber,
+            ..FieldSpec::new()
+        };
+        let float = |text| match convert_builtin_scalar(&spec, text) {
+            ConvertOutcome::Ok(ConvertedScalar::Float(f)) => f,
+            other => panic!("{text}: {other:?}"),
+        };
+        assert!(float("NaN").is_nan());
+        assert_eq!(float(" +Inf"), f64::INFINITY);
+        assert_eq!(float("-inf"), f64::NEG_INFINITY);
+        assert_eq!(float("1.5e3"), 1500.0);
+        assert_eq!(
+            convert_builtin_scalar(&spec, "42"),
+            ConvertOutcome::Ok(ConvertedScalar::Integer(42))
+        );
+    }
+
+    #[test]
+    fn radix_table_matches_presentation_types() {
+        assert_eq!(radix_for_type(Some('b')), 2);
+        assert_eq!(radix_for_type(Some('o')), 8);
+        assert_eq!(radix_for_type(Some('x')), 16);
+        assert_eq!(radix_for_type(Some('X')), 16);
+        assert_eq!(radix_for_type(Some('B')), 10);
+        assert_eq!(radix_for_type(Some('d')), 10);
+        assert_eq!(radix_for_type(Some('\u{e9}')), 10);
+        assert_eq!(radix_for_type(None), 10);
+    }
+
+    #[test]
+    fn zero_fill_parses_like_general_path() {
+        let spec = FieldSpec {
+            field_type: FieldType::Integer,
+            fill: Some('0'),
+            alignment: Some('>'),
+            width: Some(5),
+            original_type_char: Some('d'),
+            ..FieldSpec::new()
+        };
+        assert_eq!(parse_integer_text(&spec, "00042"), Ok(42));
+        assert_eq!(parse_integer_text(&spec, "-0042"), Ok(-42));
+        let spec = FieldSpec {
+            original_type_char: Some('x'),
+            ..spec
+        };
+        assert_eq!(parse_integer_text(&spec, "0001f"), Ok(31));
+    }
+
+    #[test]
+    fn swar_rejects_non_digits() {
+        for text in [
+            "",
+            "-",
+            "12a",
+            "1 2",
+            " 1",
+            "0x1f",
+            "1_000",
+            "1.5",
+            "\u{661}",
+            "12345678901234567",
+        ] {
+            assert_eq!(parse_decimal_swar(text), None, "{text}");
+        }
+    }
+}
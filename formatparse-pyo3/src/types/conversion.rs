@@ -1,8 +1,11 @@
 use crate::datetime;
 use crate::error;
-use crate::types::builtin_convert::{convert_builtin_scalar, ConvertOutcome};
+use crate::types::builtin_convert::{
+    borrowed_string_capture, convert_builtin_scalar, ConvertOutcome,
+};
 use formatparse_core::{FieldSpec, FieldType};
 use pyo3::prelude::*;
+use pyo3::types::PyString;
 use pyo3::IntoPyObjectExt;
 use std::collections::HashMap;
 
@@ -197,50 +200,100 @@ pub(crate) fn trim_string_or_multiline_value<'a>(
     Cow::Borrowed(trimmed)
 }
 
+/// Name a custom converter for this field is registered under (custom converters can
+/// also override the built-in type letters).
+fn converter_type_name(field_type: &FieldType) -> &str {
+    match field_type {
+        FieldType::Custom(name) => name.as_str(),
+        FieldType::String => "s",
+        FieldType::Integer => "d",
+        FieldType::Float => "f",
+        FieldType::Boolean => "b",
+        FieldType::Letters => "l",
+        FieldType::Word => "w",
+        FieldType::NonLetters => "W",
+        FieldType::NonWhitespace => "S",
+        FieldType::NonDigits => "D",
+        FieldType::NumberWithThousands => "n",
+        FieldType::Scientific => "e",
+        FieldType::GeneralNumber => "g",
+        FieldType::Percentage => "%",
+        FieldType::DateTimeISO => "ti",
+        FieldType::DateTimeRFC2822 => "te",
+        FieldType::DateTimeGlobal => "tg",
+        FieldType::DateTimeUS => "ta",
+        FieldType::DateTimeCtime => "tc",
+        FieldType::DateTimeHTTP => "th",
+        FieldType::DateTimeTime => "tt",
+        FieldType::DateTimeSystem => "ts",
+        FieldType::DateTimeStrftime => "strftime",
+        FieldType::BracedContent => "brace",
+        FieldType::Multiline => "ml",
+        FieldType::IndentBlock => "blk",
+        FieldType::Nested => "nested",
+    }
+}
+
+/// The converter in `custom_converters` that replaces the built-in conversion of `spec`.
+pub fn custom_converter_for<'c>(
+    spec: &FieldSpec,
+    custom_converters: &'c HashMap<String, Py<PyAny>>,
+) -> Option<&'c Py<PyAny>> {
+    // Fast path: if no custom converters, skip the lookup entirely
+    if custom_converters.is_empty() {
+        return None;
+    }
+    custom_converters.get(converter_type_name(&spec.field_type))
+}
+
+/// [`custom_converter_for`] for every field, resolved once per call so multi-match scans
+/// index by field instead of hashing the type name for each match.
+///
+/// Empty when there are no custom converters.
+pub fn resolve_field_converters(
+    py: Python<'_>,
+    field_specs: &[FieldSpec],
+    custom_converters: &HashMap<String, Py<PyAny>>,
+) -> Vec<Option<Py<PyAny>>> {
+    if custom_converters.is_empty() {
+        return Vec::new();
+    }
+    field_specs
+        .iter()
+        .map(|spec| custom_converter_for(spec, custom_converters).map(|c| c.clone_ref(py)))
+        .collect()
+}
+
 pub fn convert_value(
     spec: &FieldSpec,
     value: &str,
     py: Python,
     custom_converters: &HashMap<String, Py<PyAny>>,
 ) -> PyResult<Py<PyAny>> {
-    // Fast path: if no custom converters, skip the lookup entirely
-    if !custom_converters.is_empty() {
-        // Check if this type has a custom converter (even if it's a built-in type name)
-        let type_name = match &spec.field_type {
-            FieldType::Custom(name) => name.as_str(),
-            FieldType::String => "s",
-            FieldType::Integer => "d",
-            FieldType::Float => "f",
-            FieldType::Boolean => "b",
-            FieldType::Letters => "l",
-            FieldType::Word => "w",
-            FieldType::NonLetters => "W",
-            FieldType::NonWhitespace => "S",
-            FieldType::NonDigits => "D",
-            FieldType::NumberWithThousands => "n",
-            FieldType::Scientific => "e",
-            FieldType::GeneralNumber => "g",
-            FieldType::Percentage => "%",
-            FieldType::DateTimeISO => "ti",
-            FieldType::DateTimeRFC2822 => "te",
-            FieldType::DateTimeGlobal => "tg",
-            FieldType::DateTimeUS => "ta",
-            FieldType::DateTimeCtime => "tc",
-            FieldType::DateTimeHTTP => "th",
-            FieldType::DateTimeTime => "tt",
-            FieldType::DateTimeSystem => "ts",
-            FieldType::DateTimeStrftime => "strftime",
-            FieldType::BracedContent => "brace",
-            FieldType::Multiline => "ml",
-            FieldType::IndentBlock => "blk",
-            FieldType::Nested => "nested",
-        };
+    convert_value_with(
+        spec,
+        value,
+        py,
+        custom_converter_for(spec, custom_converters),
+    )
+}
 
-        // If there's a custom converter for this type name, use it instead of built-in
-        if let Some(converter) = custom_converters.get(type_name) {
-            let args = (value,);
-            return converter.call1(py, args);
-        }
+/// [`convert_value`] with the field's custom converter already looked up.
+pub fn convert_value_with(
+    spec: &FieldSpec,
+    value: &str,
+    py: Python,
+    converter: Option<&Py<PyAny>>,
+) -> PyResult<Py<PyAny>> {
+    // A custom converter registered for this type name wins over the built-in conversion
+    if let Some(converter) = converter {
+        return converter.call1(py, (value,));
+    }
+
+    // String-typed captures go straight from the input slice to a Python str: one copy, no
+    // intermediate owned `String`.
+    if let Some(text) = borrowed_string_capture(spec, value) {
+        return Ok(PyString::new(py, text).into_any().unbind());
     }
 
     match convert_builtin_scalar(spec, value) {
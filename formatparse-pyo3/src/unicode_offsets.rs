@@ -36,6 +36,14 @@ pub(crate) fn search_byte_range(
     pos: usize,
     endpos: Option<usize>,
 ) -> Option<(usize, usize)> {
+    if s.is_ascii() {
+        // One byte per char: the indices are already byte offsets.
+        let end = endpos.unwrap_or(s.len());
+        if pos > s.len() || end > s.len() || end < pos {
+            return None;
+        }
+        return Some((pos, end));
+    }
     let char_count = char_len(s);
     if pos > char_count {
         return None;
@@ -75,6 +83,15 @@ mod tests {
         assert_eq!(search_byte_range(s, 1, None), Some((4, s.len())));
     }
 
+    #[test]
+    fn ascii_range_is_identity() {
+        let s = "value=42";
+        assert_eq!(search_byte_range(s, 2, Some(5)), Some((2, 5)));
+        assert_eq!(search_byte_range(s, 3, None), Some((3, s.len())));
+        assert_eq!(search_byte_range(s, 9, None), None);
+        assert_eq!(search_byte_range(s, 5, Some(2)), None);
+    }
+
     #[test]
     fn byte_to_char_roundtrip() {
         let s = "🚀ab";
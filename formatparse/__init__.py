@@ -88,12 +88,15 @@ from ._native import (
 )
 from ._version import __version__
 from .api import (
+    CacheInfo,
     ValidatedParser,
     compile,
     findall,
     findall_iter,
     parse,
     parse_batch,
+    parse_cache_clear,
+    parse_cache_info,
     parse_with_validation,
     search,
 )
@@ -138,6 +141,9 @@ __all__ = [
     "search",
     "findall",
     "findall_iter",
+    "parse_cache_info",
+    "parse_cache_clear",
+    "CacheInfo",
     "RepeatedNameError",
     "with_pattern",
     "composed_type",
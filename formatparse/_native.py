@@ -9,6 +9,8 @@ from _formatparse import (
     findall as _findall,
     findall_iter as _findall_iter,
     compile as _compile,
+    cache_info as _cache_info,
+    cache_clear as _cache_clear,
     ParseResult,
     FormatParser,
     FindallIter,
@@ -24,6 +26,8 @@ __all__ = [
     "_findall",
     "_findall_iter",
     "_compile",
+    "_cache_info",
+    "_cache_clear",
     "ParseResult",
     "FormatParser",
     "FindallIter",
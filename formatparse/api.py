@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
-from typing import Any, Iterator, List, Optional, Sequence, Union
+from typing import Any, Iterator, List, NamedTuple, Optional, Sequence, Union
 
 from ._native import (
     FormatParser,
     ParseResult,
     Results,
+    _cache_clear,
+    _cache_info,
     _compile,
     _findall,
     _findall_iter,
@@ -20,6 +22,39 @@ from .types import ExtraTypes, ValidationMode, ValidatorMap
 from .validation import ValidationPipeline, post_parse_validate
 
 
+class CacheInfo(NamedTuple):
+    """Statistics for the compiled-parser cache (same fields as :func:`functools.lru_cache`)."""
+
+    hits: int
+    misses: int
+    maxsize: int
+    currsize: int
+
+
+def parse_cache_info() -> CacheInfo:
+    """Report hits, misses, capacity, and size of the compiled-parser cache.
+
+    :func:`parse`, :func:`search`, :func:`findall`, :func:`findall_iter`,
+    :func:`parse_batch`, and :func:`compile` all resolve patterns through one bounded
+    LRU cache in the native extension, so repeated calls with the same pattern string
+    reuse the compiled regex instead of rebuilding it. Also available as
+    ``parse.cache_info()``.
+
+    :returns: ``CacheInfo(hits, misses, maxsize, currsize)``
+    :rtype: CacheInfo
+    """
+    return CacheInfo(*_cache_info())
+
+
+def parse_cache_clear() -> None:
+    """Empty the compiled-parser cache and reset its counters.
+
+    Parsers already returned by :func:`compile` keep working. Also available as
+    ``parse.cache_clear()``.
+    """
+    _cache_clear()
+
+
 def compile(pattern: str, extra_types: Optional[ExtraTypes] = None) -> FormatParser:
     """Compile a pattern into a FormatParser for repeated use.
 
@@ -143,6 +178,9 @@ def parse(
         ('Hello', 'World')
     """
     r = _parse(pattern, string, extra_types, case_sensitive, evaluate_result)
+    if validators is None and pipeline is None:
+        # Plain parse (the common case): no validation step to dispatch to.
+        return r
     return post_parse_validate(
         r,
         validators=validators,
@@ -151,6 +189,11 @@ def parse(
     )
 
 
+# ``functools.lru_cache``-style introspection on the most common entry point.
+parse.cache_info = parse_cache_info  # type: ignore[attr-defined]
+parse.cache_clear = parse_cache_clear  # type: ignore[attr-defined]
+
+
 def parse_with_validation(
     parser: FormatParser,
     string: str,
@@ -2,7 +2,10 @@
 
 from __future__ import annotations
 
+import enum
+import functools
 import re
+import string
 from typing import Any, Dict, List, Optional, Tuple, Union, cast
 
 from ._native import FormatParser, ParseResult
@@ -12,6 +15,14 @@ from .types import ExtraTypes, FieldConstraint
 _UNSAFE_FORMAT_FIELD_RE = re.compile(r"\{([^}:]*[.\[][^}:]*)(?::[^}]*)?\}")
 
 
+class _FormatLayout(enum.Enum):
+    """How ``format()`` maps values onto the pattern, decided once per pattern."""
+
+    NAMED = "named"  # only named fields: ``pattern.format_map(named)``
+    POSITIONAL = "positional"  # only positional fields: ``pattern.format(*fixed)``
+    MIXED = "mixed"  # anything else: rebuild args/kwargs per call
+
+
 def _reject_unsafe_format_pattern(pattern: str) -> None:
     """Reject patterns that could use str.format attribute or item access."""
     if _UNSAFE_FORMAT_FIELD_RE.search(pattern):
@@ -21,13 +32,44 @@ def _reject_unsafe_format_pattern(pattern: str) -> None:
         )
 
 
+def _format_layout(
+    pattern: str, field_constraints: List[FieldConstraint]
+) -> _FormatLayout:
+    """Pick the cheapest ``str.format`` call that is equivalent for this pattern.
+
+    The direct calls are only used when ``str.format`` would look up exactly the
+    compiled fields, so no nested ``{}`` inside a format spec.
+    """
+    try:
+        fields = [
+            (name, spec or "")
+            for _, name, spec, _ in string.Formatter().parse(pattern)
+            if name is not None
+        ]
+    except ValueError:
+        return _FormatLayout.MIXED
+    if any("{" in spec for _, spec in fields):
+        return _FormatLayout.MIXED
+    names = [constraint["name"] for constraint in field_constraints]
+    if names and all(names) and {name for name, _ in fields} == set(names):
+        return _FormatLayout.NAMED
+    if not any(names):
+        return _FormatLayout.POSITIONAL
+    return _FormatLayout.MIXED
+
+
 def _format_args_kwargs(
     pattern: str,
     field_constraints: List[FieldConstraint],
     named: Dict[str, Any],
     fixed: List[Any],
+    layout: _FormatLayout = _FormatLayout.MIXED,
 ) -> str:
     """Format using field constraint order for mixed named and positional fields."""
+    if layout is _FormatLayout.NAMED and type(named) is dict:
+        return pattern.format_map(named)
+    if layout is _FormatLayout.POSITIONAL:
+        return pattern.format(*fixed)
     args: List[Any] = []
     kwargs: Dict[str, Any] = {}
     pos_idx = 0
@@ -65,6 +107,14 @@ def _constraints_from_parser(parser: FormatParser) -> List[FieldConstraint]:
     return constraints
 
 
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
 class BidirectionalPattern:
     """A bidirectional pattern that can parse and format strings.
 
@@ -93,6 +143,14 @@ class BidirectionalPattern:
         '      John: 00100'
     """
 
+    __slots__ = (
+        "_parser",
+        "_pattern",
+        "_extra_types",
+        "_field_constraints",
+        "_format_layout",
+    )
+
     def __init__(self, pattern: str, extra_types: Optional[ExtraTypes] = None) -> None:
         """Initialize a bidirectional pattern.
 
@@ -108,6 +166,47 @@ class BidirectionalPattern:
         self._field_constraints: List[FieldConstraint] = _constraints_from_parser(
             self._parser
         )
+        self._format_layout: _FormatLayout = _format_layout(
+            pattern, self._field_constraints
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {slot: getattr(self, slot) for slot in BidirectionalPattern.__slots__}
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        for slot, value in state.items():
+            setattr(self, slot, value)
+        if "_format_layout" not in state:
+            # Pickled before the layout was stored on the instance.
+            self._format_layout = _format_layout(self._pattern, self._field_constraints)
+
+    @classmethod
+    def get(
+        cls, pattern: str, extra_types: Optional[ExtraTypes] = None
+    ) -> "BidirectionalPattern":
+        """Return a shared instance for ``pattern``, compiling it on first use.
+
+        Instances are never mutated by :meth:`parse`, :meth:`format`, or
+        :meth:`validate`, so one instance can serve every caller (including other
+        threads). Up to 256 patterns are kept, keyed by ``pattern`` and the
+        ``extra_types`` items; unhashable converters and subclasses bypass the cache.
+
+        :param pattern: Format string pattern
+        :type pattern: str
+        :param extra_types: Optional dictionary of custom type converters
+        :type extra_types: dict, optional
+        :returns: The cached pattern
+        :rtype: BidirectionalPattern
+
+        Example::
+
+            >>> BidirectionalPattern.get("{x:d}") is BidirectionalPattern.get("{x:d}")
+            True
+        """
+        key = tuple(sorted(extra_types.items())) if extra_types else ()
+        if cls is not BidirectionalPattern or not _is_hashable(key):
+            return cls(pattern, extra_types=extra_types)
+        return _shared_pattern(pattern, key)
 
     def parse(
         self, string: str, case_sensitive: bool = False, evaluate_result: bool = True
@@ -161,6 +260,12 @@ class BidirectionalPattern:
             >>> formatter.format(("John", 42))  # Positional fields
             '      John: 00042'
         """
+        # Values already in the shape this pattern's layout consumes go straight to
+        # ``str.format``, without the generic dispatch below.
+        if type(values) is dict and self._format_layout is _FormatLayout.NAMED:
+            return self._pattern.format_map(values)
+        if type(values) is tuple and self._format_layout is _FormatLayout.POSITIONAL:
+            return self._pattern.format(*values)
         if isinstance(values, ParseResult):
             named = dict(values.named) if values.named else {}
             fixed = list(values.fixed) if values.fixed else []
@@ -172,7 +277,9 @@ class BidirectionalPattern:
             fixed = list(values)
         else:
             return self._pattern.format(values)
-        return _format_args_kwargs(self._pattern, self._field_constraints, named, fixed)
+        return _format_args_kwargs(
+            self._pattern, self._field_constraints, named, fixed, self._format_layout
+        )
 
     def validate(
         self, values: Union[dict, tuple, ParseResult, "_MixedValues"]
@@ -269,6 +376,14 @@ class _MixedValues:
         self.fixed = fixed
 
 
+@functools.lru_cache(maxsize=256)
+def _shared_pattern(
+    pattern: str, extra_types_key: Tuple[Tuple[str, Any], ...]
+) -> BidirectionalPattern:
+    """Backing cache for :meth:`BidirectionalPattern.get`."""
+    return BidirectionalPattern(pattern, extra_types=dict(extra_types_key) or None)
+
+
 class BidirectionalResult:
     """Result from BidirectionalPattern.parse() that allows modification and formatting.
 
@@ -288,6 +403,8 @@ class BidirectionalResult:
         (True, [])
     """
 
+    __slots__ = ("_pattern", "_result", "_named", "_fixed")
+
     def __init__(self, pattern: BidirectionalPattern, result: ParseResult) -> None:
         """Initialize a bidirectional result.
 
@@ -357,6 +474,7 @@ class BidirectionalResult:
             self._pattern._field_constraints,
             self._named,
             self._fixed,
+            self._pattern._format_layout,
         )
 
     def validate(self) -> Tuple[bool, List[str]]:
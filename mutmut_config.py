@@ -2,16 +2,15 @@
 
 Run mutation tests with: mutmut run
 View mutations with: mutmut show
-"""
 
-# Path to the package to mutate
-paths_to_mutate = [
-    "formatparse/",
-]
+``paths_to_mutate`` and ``test_command`` live in ``[tool.mutmut]`` in
+pyproject.toml. Keep them only there so the two files cannot disagree.
+"""
 
-# Command to run tests
-# Note: Do not define tests_dir - mutmut will infer it from test_command
-test_command = "env PYTEST_DISABLE_PLUGIN_AUTOLOAD=1 python -m pytest tests -x"
+import json
+import os
+import shlex
+from pathlib import Path
 
 # Timeout for test runs (in seconds)
 test_timeout = 300
@@ -28,9 +27,55 @@ exclude = [
     "*/conftest.py",
 ]
 
-# Pre-mutation hook (optional)
-# def pre_mutation(context):
-#     pass
+# Coverage-guided test selection: run only the tests that execute the mutated
+# line. Build the map once per source revision (see CONTRIBUTING.md):
+#   python -m pytest tests --cov=formatparse --cov-context=test
+#   coverage json --show-contexts -o coverage-contexts.json
+# Without the map, or for lines no test covers, the full suite runs.
+COVERAGE_CONTEXTS = Path("coverage-contexts.json")
+
+_line_contexts = None
+_full_suite_command = None
+
+
+def _load_line_contexts():
+    """Return ``{(filename, lineno): [test node ids]}`` from the coverage map."""
+    global _line_contexts
+    if _line_contexts is None:
+        _line_contexts = {}
+        if COVERAGE_CONTEXTS.exists():
+            data = json.loads(COVERAGE_CONTEXTS.read_text())
+            for filename, info in data.get("files", {}).items():
+                for lineno, contexts in info.get("contexts", {}).items():
+                    # pytest-cov labels contexts "<node id>|run" (or "|setup", ...);
+                    # the empty context is code run outside any test.
+                    tests = sorted({c.split("|")[0] for c in contexts if c})
+                    if tests:
+                        _line_contexts[(os.path.normpath(filename), int(lineno))] = (
+                            tests
+                        )
+    return _line_contexts
+
+
+def tests_for(filename, line_index):
+    """Test node ids covering ``filename`` at 0-based ``line_index`` (may be empty)."""
+    return _load_line_contexts().get((os.path.normpath(filename), line_index + 1), [])
+
+
+def pre_mutation(context):
+    """Narrow the pytest run for this mutant to the tests covering its line."""
+    global _full_suite_command
+    # mutmut shares one config across mutants, so always start from the
+    # original full-suite command rather than the previous mutant's selection.
+    if _full_suite_command is None:
+        _full_suite_command = context.config.test_command
+    command = _full_suite_command
+    tests = tests_for(context.filename, context.current_line_index)
+    if tests and " tests " in command:
+        selected = " ".join(shlex.quote(t) for t in tests)
+        command = command.replace(" tests ", f" {selected} ", 1)
+    context.config.test_command = command
+
 
 # Post-mutation hook (optional)
 # def post_mutation(context):
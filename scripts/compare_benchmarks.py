@@ -4,35 +4,84 @@
 import json
 import sys
 
-try:
-    with open("baseline_benchmarks.json") as f:
-        baseline = json.load(f)
-    with open("benchmark_results.json") as f:
-        current = json.load(f)
-
-    # Create dicts for easy lookup
-    baseline_dict = {b["name"]: b["stats"]["mean"] for b in baseline["benchmarks"]}
-    current_dict = {c["name"]: c["stats"]["mean"] for c in current["benchmarks"]}
-
-    regressions = []
-    for name, current_mean in current_dict.items():
-        if name in baseline_dict:
-            baseline_mean = baseline_dict[name]
-            if baseline_mean > 0:
-                change_pct = ((current_mean - baseline_mean) / baseline_mean) * 100
-                if change_pct > 10:  # More than 10% slower
-                    regressions.append((name, change_pct, baseline_mean, current_mean))
+try:  # Optional: faster parsing of large result files when installed.
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
+try:  # Optional: stream means out of large result files without loading them.
+    import ijson
+except ImportError:
+    ijson = None
+
+# Flag benchmarks whose mean got more than this many percent slower.
+REGRESSION_THRESHOLD_PCT = 10.0
+
+BASELINE_FILE = "baseline_benchmarks.json"
+CURRENT_FILE = "benchmark_results.json"
+
+
+def load_means(path):
+    """Return ``{benchmark name: stats.mean}`` from a pytest-benchmark JSON file.
+
+    With ``ijson`` installed the file is streamed and only the name/mean pairs
+    are kept; otherwise the whole document is parsed.
+    """
+    if ijson is None:
+        with open(path, "rb") as f:
+            data = _loads(f.read())
+        return {b["name"]: b["stats"]["mean"] for b in data["benchmarks"]}
+
+    means = {}
+    name = mean = None
+    with open(path, "rb") as f:
+        for prefix, event, value in ijson.parse(f, use_float=True):
+            if prefix == "benchmarks.item.name":
+                name = value
+            elif prefix == "benchmarks.item.stats.mean":
+                mean = value
+            elif prefix == "benchmarks.item" and event == "end_map":
+                means[name] = mean
+                name = mean = None
+    return means
 
+
+def find_regressions(baseline_dict, current_dict, threshold=REGRESSION_THRESHOLD_PCT):
+    """Return ``(name, change_pct, baseline_mean, current_mean)`` rows over ``threshold``.
+
+    Only names present in both mappings are compared; a non-positive baseline
+    mean is treated as "no change".
+    """
+    # Column-wise pass over the names both runs share (aligned by index). The
+    # dict-view intersection runs in C; sorting keeps the report deterministic.
+    names = sorted(current_dict.keys() & baseline_dict.keys())
+    base = [baseline_dict[name] for name in names]
+    cur = [current_dict[name] for name in names]
+    pct = [(c - b) / b * 100.0 if b > 0 else 0.0 for b, c in zip(base, cur)]
+    return [row for row in zip(names, pct, base, cur) if row[1] > threshold]
+
+
+def report(regressions, threshold=REGRESSION_THRESHOLD_PCT):
+    """Print the comparison verdict and return the process exit code."""
     if regressions:
-        print("Performance regressions detected (>10% slower):")
+        print(f"Performance regressions detected (>{threshold:g}% slower):")
         for name, pct, baseline, current in regressions:
             print(f"  {name}: {pct:.2f}% slower ({baseline:.6f}s -> {current:.6f}s)")
-        sys.exit(1)
-    else:
-        print("No significant performance regressions detected.")
+        return 1
+    print("No significant performance regressions detected.")
+    return 0
+
+
+try:
+    baseline_dict = load_means(BASELINE_FILE)
+    current_dict = load_means(CURRENT_FILE)
+
+    threshold = REGRESSION_THRESHOLD_PCT
+    regressions = find_regressions(baseline_dict, current_dict, threshold)
+    sys.exit(report(regressions, threshold))
 except FileNotFoundError:
     print("No baseline found, creating one...")
     import shutil
 
-    shutil.copy("benchmark_results.json", "baseline_benchmarks.json")
+    shutil.copy(CURRENT_FILE, BASELINE_FILE)
     print("Baseline created successfully.")
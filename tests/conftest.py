@@ -1,7 +1,9 @@
 """Pytest configuration and shared fixtures for formatparse tests"""
 
+import gc
+
 import pytest
-from formatparse import with_pattern
+from formatparse import BidirectionalPattern, with_pattern
 
 _INDENT_BLOCK_SKIP_REASON = (
     "Indent-block :blk tests need a matching _formatparse build. From the repo root "
@@ -23,7 +25,21 @@ def _native_indent_block_capable() -> bool:
     return r is not None and r.named.get("x") == "hi\nthere"
 
 
+def pytest_addoption(parser):
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked slow (skipped by default)",
+    )
+
+
 def pytest_collection_modifyitems(config, items):
+    if not config.getoption("--runslow"):
+        skip_slow = pytest.mark.skip(reason="slow test; pass --runslow to run")
+        for item in items:
+            if "slow" in item.keywords:
+                item.add_marker(skip_slow)
     if _native_indent_block_capable():
         return
     skip_m = pytest.mark.skip(reason=_INDENT_BLOCK_SKIP_REASON)
@@ -32,7 +48,19 @@ def pytest_collection_modifyitems(config, items):
             item.add_marker(skip_m)
 
 
-@pytest.fixture
+def pytest_runtest_teardown(item, nextitem):
+    """Collect garbage after each Hypothesis fuzz test.
+
+    Fuzz tests build many large throwaway strings and results (plus shrink
+    candidates); collecting here keeps that from piling up across a long run.
+    This is cheaper than forking a process per test (``pytest --forked``),
+    at the cost of one ``gc.collect()`` per fuzz test.
+    """
+    if item.name.startswith("test_fuzz_"):
+        gc.collect()
+
+
+@pytest.fixture(scope="session")
 def sample_patterns():
     """Common test patterns used across smoke and integration tests."""
     return {
@@ -44,7 +72,7 @@ def sample_patterns():
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_strings():
     """Test strings paired with :func:`sample_patterns`."""
     return {
@@ -56,18 +84,22 @@ def sample_strings():
     }
 
 
-@pytest.fixture
-def custom_type_converters():
-    """Common custom type converters for tests that need extra_types."""
+@with_pattern(r"\d+")
+def parse_number(text):
+    return int(text)
+
 
-    @with_pattern(r"\d+")
-    def parse_number(text):
-        return int(text)
+@with_pattern(r"[A-Za-z]+")
+def parse_word(text):
+    return text.upper()
 
-    @with_pattern(r"[A-Za-z]+")
-    def parse_word(text):
-        return text.upper()
 
+@pytest.fixture(scope="session")
+def custom_type_converters():
+    """Common custom type converters for tests that need extra_types."""
+
+    # Kept local: its (text, start, end) signature does not fit with_pattern's
+    # single-argument converter type, which mypy checks at module scope.
     @with_pattern(r"(\d+)-(\d+)", regex_group_count=2)
     def parse_range(text, start, end):
         return (int(start), int(end))
@@ -79,6 +111,12 @@ def custom_type_converters():
     }
 
 
+@pytest.fixture(scope="session")
+def name_value_bidi():
+    """Shared ``"{name}: {value:d}"`` :class:`BidirectionalPattern` (read-only)."""
+    return BidirectionalPattern("{name}: {value:d}")
+
+
 def assert_parse_result(result, expected_named=None, expected_fixed=None):
     """Assert a parse/search result has expected named and fixed values."""
     assert result is not None
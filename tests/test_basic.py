@@ -168,5 +168,15 @@ def test_case_sensitive():
     assert result2.named["name"] == "World"
 
 
+def test_case_insensitive_literal_checks_follow_unicode_folding():
+    """Literal prechecks fold ASCII case but leave Unicode folds to the regex."""
+    assert parse("Start: {} End", "start: x end").fixed == ("x",)
+    assert parse("Start: {} End", "stop: x end") is None
+    assert search("ID:{:d}", "x id 7") is None
+    # U+212A KELVIN SIGN and U+017F LONG S fold to 'k' and 's' under (?i).
+    assert parse("sk{}", "\u017f\u212a1").fixed == ("1",)
+    assert search("K{:d}", "\u212a5").fixed == (5,)
+
+
 if __name__ == "__main__":
     pytest.main([__file__])
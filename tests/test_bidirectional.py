@@ -1,6 +1,7 @@
 """Comprehensive tests for BidirectionalPattern and BidirectionalResult"""
 
 from formatparse import BidirectionalPattern
+from formatparse.bidirectional import _FormatLayout
 
 
 def test_basic_round_trip_named_fields():
@@ -241,6 +242,73 @@ def test_field_constraints_from_compiled_parser():
     assert formatter._field_constraints[0]["name"] == "outer"
 
 
+def test_format_layout_chosen_once_per_pattern():
+    """Named-only and positional-only patterns format with a single str.format call."""
+    named = BidirectionalPattern("{name:>10}: {value:05d}")
+    positional = BidirectionalPattern("{}, {:d}")
+    mixed = BidirectionalPattern("{name}: {:d}")
+    nested = BidirectionalPattern("{outer:{inner:d}}")
+
+    assert named._format_layout is _FormatLayout.NAMED
+    assert positional._format_layout is _FormatLayout.POSITIONAL
+    assert mixed._format_layout is _FormatLayout.MIXED
+    assert nested._format_layout is _FormatLayout.MIXED
+
+    assert named.format({"name": "John", "value": 42}) == "      John: 00042"
+    assert positional.format(("Hello", 7)) == "Hello, 7"
+    assert mixed.parse("Bob: 3").format() == "Bob: 3"
+
+
+def test_named_format_matches_format_map():
+    """Named-only patterns format like str.format_map, also after pickling."""
+    import pickle
+
+    pattern = "{{'\"{name:>6}\"'}} \\ {value:05d}"
+    formatter = BidirectionalPattern(pattern)
+    values = {"name": "John", "value": 42}
+
+    assert formatter.format(values) == pattern.format_map(values)
+
+    restored = pickle.loads(pickle.dumps(formatter))
+    assert restored._format_layout is formatter._format_layout
+    assert restored.format(values) == pattern.format_map(values)
+
+
+def test_get_returns_shared_instance():
+    """BidirectionalPattern.get caches by pattern and extra_types."""
+    from formatparse import with_pattern
+
+    @with_pattern(r"\d+")
+    def parse_number(text):
+        return int(text)
+
+    shared = BidirectionalPattern.get("{name:>10}: {value:05d}")
+    assert shared is BidirectionalPattern.get("{name:>10}: {value:05d}")
+    assert shared.format({"name": "John", "value": 42}) == "      John: 00042"
+
+    extra = {"Number": parse_number}
+    custom = BidirectionalPattern.get("{value:Number}", extra)
+    assert custom is BidirectionalPattern.get("{value:Number}", dict(extra))
+    assert custom.parse("42").named["value"] == 42
+
+
+def test_unpickle_state_without_format_layout():
+    """State pickled before the layout was stored recomputes it on load."""
+    original = BidirectionalPattern("{name:>10}: {value:05d}")
+    state = {
+        "_parser": original._parser,
+        "_pattern": original._pattern,
+        "_extra_types": original._extra_types,
+        "_field_constraints": original._field_constraints,
+    }
+
+    restored = BidirectionalPattern.__new__(BidirectionalPattern)
+    restored.__setstate__(state)
+
+    assert restored._format_layout is _FormatLayout.NAMED
+    assert restored.format({"name": "John", "value": 42}) == "      John: 00042"
+
+
 def test_validate_empty_result():
     """Test validation with empty or missing fields"""
     formatter = BidirectionalPattern("{name}, {age:d}")
@@ -3,7 +3,14 @@
 from __future__ import annotations
 
 import formatparse
-from formatparse import compile, parse, search, with_pattern
+from formatparse import (
+    compile,
+    parse,
+    parse_cache_clear,
+    parse_cache_info,
+    search,
+    with_pattern,
+)
 
 
 def test_compile_twice_same_pattern_both_parse() -> None:
@@ -52,3 +59,39 @@ def test_compile_equivalent_extra_types_produces_consistent_results() -> None:
     r1 = p1.parse("7")
     r2 = p2.parse("7")
     assert r1 is not None and r2 is not None and r1.named["v"] == r2.named["v"] == 7
+
+
+def test_parse_cache_info_counts_reuse_across_free_functions() -> None:
+    """Free functions share one compiled-parser cache, visible via parse_cache_info()."""
+    parse_cache_clear()
+    info = parse_cache_info()
+    assert (info.hits, info.misses, info.currsize) == (0, 0, 0)
+    assert info.maxsize > 0
+
+    for i in range(5):
+        assert parse("id={n:d}", f"id={i}") is not None
+    assert search("id={n:d}", "x id=3 y") is not None
+    assert len(formatparse.findall("id={n:d}", "id=1 id=2")) == 2
+
+    info = parse_cache_info()
+    assert info.misses == 1
+    assert info.hits == 6
+    assert info.currsize == 1
+
+    parse_cache_clear()
+    assert parse_cache_info().currsize == 0
+
+
+def test_compiled_parser_matches_without_cache_lookup() -> None:
+    """FormatParser.parse/search reuse the parser itself when no converters are involved."""
+    parse_cache_clear()
+    parser = compile("{value:d}")
+    before = parse_cache_info()
+
+    for _ in range(3):
+        r = parser.parse("42")
+        assert r is not None and r.named["value"] == 42
+    s = parser.search("x 7 y")
+    assert s is not None and s.named["value"] == 7
+
+    assert parse_cache_info() == before
@@ -172,3 +172,43 @@ def test_findall_results_negative_index():
     assert r[-3].named["id"] == 1
     with pytest.raises(IndexError):
         _ = r[-4]
+
+
+def test_findall_missing_literal_keeps_return_type():
+    """A haystack without the pattern's literal yields an empty result of the usual type."""
+    from formatparse import Results
+
+    r = findall("ID:{id:d}", "no identifiers here", case_sensitive=True)
+    assert isinstance(r, Results) and len(r) == 0
+
+    m = findall("ID:{id:d}", "no identifiers here", evaluate_result=False)
+    assert isinstance(m, list) and m == []
+
+    # Case-insensitive scans must not reject on the literal's case.
+    assert [x.named["id"] for x in findall("ID:{id:d}", "id:4 Id:5")] == [4, 5]
+
+
+def test_findall_from_threads():
+    """The GIL-free raw scan returns the same results when run from several threads."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    text = " ".join(f"ID:{i}" for i in range(2000))
+    expected = list(range(2000))
+
+    def scan(_):
+        return [r.named["id"] for r in findall("ID:{id:d}", text)]
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        for ids in pool.map(scan, range(8)):
+            assert ids == expected
+
+
+def test_findall_literal_then_int_follows_regex_semantics():
+    """``literal{name:d}`` patterns skip the regex but report the same matches."""
+    text = "ID:1 id:0x1F ID:x ID: 7 ID:-3 ID:0b12"
+    results = findall("ID:{id:d}", text)
+    assert [r.named["id"] for r in results] == [1, 31, 7, -3, 1]
+    assert [r.spans["id"] for r in results][:2] == [(3, 4), (8, 12)]
+    assert len(findall("ID:{id:d}", "Id:9 ID:8", case_sensitive=True)) == 1
+    # Non-ASCII input under case folding goes through the regex scan.
+    assert [r.named["id"] for r in findall("ID:{id:d}", "id:2 \u212a")] == [2]
@@ -328,3 +328,23 @@ def test_parser_unicode_pattern():
     assert result is not None
     assert result.named["name"] == "Alice"
     assert "世界" in result.named["message"]
+
+
+def test_single_int_field_matches_regex_path():
+    """A bare ``{name:d}`` pattern gives the same result with or without the regex."""
+    parser = compile("{value:d}")
+    for text, expected in [("42", 42), ("-7", -7), ("+0012", 12)]:
+        result = parser.parse(text)
+        assert result.named == {"value": expected}
+        assert result.fixed == ()
+        assert result.span == (0, len(text))
+        assert result.spans["value"] == (0, len(text))
+
+    # Inputs outside the digit-only fast path still go through the regex.
+    assert parser.parse("  42").named["value"] == 42
+    assert parser.parse("0x1f").named["value"] == 31
+    assert parser.parse("12345678901234567").named["value"] == 12345678901234567
+    assert parser.parse("4a") is None
+    assert parser.parse("42", evaluate_result=False).evaluate_result().named == {
+        "value": 42
+    }
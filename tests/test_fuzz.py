@@ -4,62 +4,107 @@ These tests use Hypothesis to generate random inputs and ensure
 the library never crashes on unexpected input.
 """
 
+import functools
+
 import pytest
-from hypothesis import given, strategies as st, settings, HealthCheck
-from formatparse import parse, search, findall, compile
+from hypothesis import given, strategies as st, settings
+from formatparse import (
+    FormatParser,
+    ParseResult,
+    Results,
+    parse,
+    findall,
+    compile,
+    search,
+)
 
+# Pattern-shaped inputs: literal runs interleaved with ``{name[:spec]}`` fields.
+# Stray braces in the literal alphabet keep unbalanced/malformed shapes in play.
+_field_spec = st.one_of(
+    st.just(""),
+    st.sampled_from([":d", ":f", ":s", ":>4", ":.2f", ":%Y-%m-%d"]),
+)
+_field = st.builds(
+    lambda name, spec: "{" + name + spec + "}",
+    st.text(st.characters(whitelist_categories=("Ll", "Lu")), min_size=1, max_size=6),
+    _field_spec,
+)
+_pattern = st.lists(
+    st.one_of(st.text(alphabet=" abc:,.-{}", max_size=10), _field),
+    min_size=1,
+    max_size=6,
+).map("".join)
 
-@settings(max_examples=500)
-@given(
-    pattern=st.text(min_size=1, max_size=200), text=st.text(min_size=0, max_size=1000)
+
+@functools.lru_cache(maxsize=4096)
+def _cached_compile(pattern):
+    """Compile ``pattern`` once per unique string; ``None`` if it is invalid."""
+    try:
+        return compile(pattern)
+    except ValueError:
+        return None
+
+
+# Well-formed format strings: literal characters and ``{name[:spec]}`` fields.
+_well_formed_pattern = st.from_regex(
+    r"(\{[a-z_][a-z0-9_]*(:[^{}]{0,8})?\}|[A-Za-z0-9 :,.\-]){1,8}", fullmatch=True
 )
-def test_fuzz_parse_crash_free(pattern, text):
-    """Fuzz test: parse() should never crash on any input"""
+
+
+def _check_all_apis_crash_free(pattern, text):
+    """parse(), search() and findall() must return or raise ValueError/TypeError."""
+    # Each API is guarded separately so one expected error does not skip the rest.
+    # ValueError/TypeError are expected for invalid patterns; anything else is a bug.
     try:
-        result = parse(pattern, text)
+        parser = _cached_compile(pattern)
+        result = parser.parse(text) if parser else None
         # Should either return a result or None, never crash
-        assert result is None or hasattr(result, "named")
-        assert result is None or hasattr(result, "fixed")
+        assert result is None or isinstance(result, ParseResult)
     except (ValueError, TypeError):
-        # Expected exceptions for invalid patterns are fine
         pass
     except Exception as e:
-        # Unexpected exceptions indicate bugs
-        pytest.fail(f"Unexpected exception on pattern={pattern!r}, text={text!r}: {e}")
+        pytest.fail(
+            f"Unexpected parse() exception on pattern={pattern!r}, text={text!r}: {e}"
+        )
 
-
-@settings(max_examples=500)
-@given(
-    pattern=st.text(min_size=1, max_size=200), text=st.text(min_size=0, max_size=1000)
-)
-def test_fuzz_search_crash_free(pattern, text):
-    """Fuzz test: search() should never crash on any input"""
     try:
-        result = search(pattern, text)
-        assert result is None or hasattr(result, "named")
+        parser = _cached_compile(pattern)
+        result = parser.search(text) if parser else None
+        assert result is None or isinstance(result, ParseResult)
     except (ValueError, TypeError):
-        # Expected exceptions for invalid patterns are fine
         pass
     except Exception as e:
-        pytest.fail(f"Unexpected exception on pattern={pattern!r}, text={text!r}: {e}")
-
+        pytest.fail(
+            f"Unexpected search() exception on pattern={pattern!r}, text={text!r}: {e}"
+        )
 
-@settings(max_examples=500)
-@given(
-    pattern=st.text(min_size=1, max_size=200), text=st.text(min_size=0, max_size=1000)
-)
-def test_fuzz_findall_crash_free(pattern, text):
-    """Fuzz test: findall() should never crash on any input"""
     try:
         results = findall(pattern, text)
         # Should return a list-like object
-        assert hasattr(results, "__len__")
-        assert hasattr(results, "__iter__")
+        assert isinstance(results, (Results, list))
     except (ValueError, TypeError):
-        # Expected exceptions for invalid patterns are fine
         pass
     except Exception as e:
-        pytest.fail(f"Unexpected exception on pattern={pattern!r}, text={text!r}: {e}")
+        pytest.fail(
+            f"Unexpected findall() exception on pattern={pattern!r}, text={text!r}: {e}"
+        )
+
+
+@pytest.mark.slow
+@settings(max_examples=500)
+@given(pattern=_well_formed_pattern, text=st.text(min_size=0, max_size=1000))
+def test_fuzz_all_apis_crash_free(pattern, text):
+    """Fuzz test: parse(), search() and findall() should never crash on any input"""
+    _check_all_apis_crash_free(pattern, text)
+
+
+@settings(max_examples=50)
+@given(
+    pattern=st.text(min_size=1, max_size=200), text=st.text(min_size=0, max_size=1000)
+)
+def test_fuzz_all_apis_raw_text_patterns(pattern, text):
+    """Fuzz test: arbitrary (mostly invalid) pattern strings never crash the APIs"""
+    _check_all_apis_crash_free(pattern, text)
 
 
 @settings(max_examples=200)
@@ -69,7 +114,7 @@ def test_fuzz_compile_crash_free(pattern):
     try:
         parser = compile(pattern)
         # Should return a parser or raise a ValueError for invalid patterns
-        assert parser is None or hasattr(parser, "parse")
+        assert parser is None or isinstance(parser, FormatParser)
     except ValueError:
         # Expected for invalid patterns
         pass
@@ -77,25 +122,21 @@ def test_fuzz_compile_crash_free(pattern):
         pytest.fail(f"Unexpected exception on pattern={pattern!r}: {e}")
 
 
-@settings(max_examples=50, suppress_health_check=[HealthCheck.filter_too_much])
-@given(
-    pattern=st.text(
-        min_size=1, max_size=50
-    ),  # Remove filter to reduce filtering overhead
-    text=st.text(min_size=0, max_size=200),
-)
+@settings(max_examples=50)
+@given(pattern=_pattern, text=st.text(min_size=0, max_size=200))
 def test_fuzz_malformed_patterns(pattern, text):
     """Fuzz test: Handle malformed patterns gracefully"""
     try:
         result = parse(pattern, text)
         # Should either parse or return None, not crash
-        assert result is None or hasattr(result, "named")
+        assert result is None or isinstance(result, ParseResult)
     except Exception:
         # Various exceptions are acceptable for malformed patterns
         # We're mainly checking for crashes/panics, not correctness
         pass
 
 
+@pytest.mark.slow
 @settings(max_examples=50)
 @given(
     text=st.text(
@@ -127,7 +168,7 @@ def test_fuzz_large_inputs(text):
         pytest.fail(f"Unexpected exception on large input (len={len(text)}): {e}")
 
 
-@settings(max_examples=50, suppress_health_check=[HealthCheck.filter_too_much])
+@settings(max_examples=50)
 @given(
     text=st.text(
         min_size=1,
@@ -150,7 +191,7 @@ def test_fuzz_unicode_inputs(text):
         pass
 
 
-@settings(max_examples=30, suppress_health_check=[HealthCheck.filter_too_much])
+@settings(max_examples=30)
 @given(
     text=st.text(
         min_size=10,
@@ -174,7 +215,7 @@ def test_fuzz_search_with_pos(text, pattern, pos, endpos):
 
     try:
         result = search(pattern, text, pos=pos, endpos=endpos)
-        assert result is None or hasattr(result, "named")
+        assert result is None or isinstance(result, ParseResult)
     except (Exception, RuntimeError, SystemError):
         # Various exceptions including panics are acceptable for fuzz testing
         # We're mainly checking for crashes, not correctness
@@ -1,6 +1,7 @@
 """Comprehensive integration tests for formatparse
 
 Systematic test matrix covering all public APIs × all type combinations.
+Matrix cases share no state, so they shard cleanly with ``pytest -n auto``.
 """
 
 import pytest
@@ -9,7 +10,6 @@ from formatparse import (
     search,
     findall,
     compile,
-    BidirectionalPattern,
     with_pattern,
 )
 
@@ -27,17 +27,26 @@ TYPE_SPECIFIERS = [
     ("g", 3.14, float, "3.14"),  # General
     ("%", 0.5, float, "50%"),  # Percentage
 ]
+_TYPE_IDS = [t[0] for t in TYPE_SPECIFIERS]
+
+# Patterns and input texts per type specifier, built once at import.
+_PARSE_PATTERNS = {t[0]: f"{{value:{t[0]}}}" for t in TYPE_SPECIFIERS}
+_SEARCH_PATTERNS = {t[0]: f"Value: {{value:{t[0]}}}" for t in TYPE_SPECIFIERS}
+_SEARCH_TEXTS = {t[0]: f"Some text Value: {t[3]} more text" for t in TYPE_SPECIFIERS}
+_FINDALL_PATTERNS = {t[0]: f"ID:{{value:{t[0]}}}" for t in TYPE_SPECIFIERS}
+_FINDALL_TEXTS = {t[0]: f"ID:{t[3]} ID:{t[3]} ID:{t[3]}" for t in TYPE_SPECIFIERS}
 
 
 @pytest.mark.parametrize(
-    "type_spec,expected_value,expected_type,test_string", TYPE_SPECIFIERS
+    "type_spec,expected_value,expected_type,test_string",
+    TYPE_SPECIFIERS,
+    ids=_TYPE_IDS,
 )
 def test_parse_all_type_specifiers(
     type_spec, expected_value, expected_type, test_string
 ):
     """Integration test: parse() with all type specifiers"""
-    pattern = f"{{value:{type_spec}}}"
-    result = parse(pattern, test_string)
+    result = parse(_PARSE_PATTERNS[type_spec], test_string)
 
     if result:
         # Handle string type specially - may parse differently
@@ -50,15 +59,15 @@ def test_parse_all_type_specifiers(
 
 
 @pytest.mark.parametrize(
-    "type_spec,expected_value,expected_type,test_string", TYPE_SPECIFIERS
+    "type_spec,expected_value,expected_type,test_string",
+    TYPE_SPECIFIERS,
+    ids=_TYPE_IDS,
 )
 def test_search_all_type_specifiers(
     type_spec, expected_value, expected_type, test_string
 ):
     """Integration test: search() with all type specifiers"""
-    pattern = f"Value: {{value:{type_spec}}}"
-    text = f"Some text Value: {test_string} more text"
-    result = search(pattern, text)
+    result = search(_SEARCH_PATTERNS[type_spec], _SEARCH_TEXTS[type_spec])
 
     if result:
         # Handle string type specially - may parse word by word
@@ -71,23 +80,23 @@ def test_search_all_type_specifiers(
 
 
 @pytest.mark.parametrize(
-    "type_spec,expected_value,expected_type,test_string", TYPE_SPECIFIERS[:5]
-)  # Limit to avoid long test
+    "type_spec,expected_value,expected_type,test_string",
+    TYPE_SPECIFIERS[:5],  # Limit to avoid long test
+    ids=_TYPE_IDS[:5],
+)
 def test_findall_all_type_specifiers(
     type_spec, expected_value, expected_type, test_string
 ):
     """Integration test: findall() with all type specifiers"""
-    pattern = f"ID:{{value:{type_spec}}}"
-    text = f"ID:{test_string} ID:{test_string} ID:{test_string}"
-    results = findall(pattern, text)
+    results = findall(_FINDALL_PATTERNS[type_spec], _FINDALL_TEXTS[type_spec])
 
     assert len(results) == 3
-    for result in results:
-        # Handle string type specially - may parse word by word
-        if expected_type is str and type_spec == "s":
-            assert isinstance(result.named["value"], str)
-        else:
-            assert result.named["value"] == expected_value
+    values = [result.named["value"] for result in results]
+    # Handle string type specially - may parse word by word
+    if expected_type is str and type_spec == "s":
+        assert all(isinstance(value, str) for value in values)
+    else:
+        assert values == [expected_value] * 3
 
 
 # Test all public API functions
@@ -163,10 +172,9 @@ def test_error_paths_systematically():
     assert result is None
 
 
-def test_bidirectional_pattern_integration():
+def test_bidirectional_pattern_integration(name_value_bidi):
     """Integration test: BidirectionalPattern end-to-end"""
-    pattern = "{name}: {value:d}"
-    formatter = BidirectionalPattern(pattern)
+    formatter = name_value_bidi
 
     # Format
     formatted = formatter.format({"name": "Test", "value": 42})
@@ -119,10 +119,11 @@ def test_findall_memory_usage():
 
         tr.print_diff()
 
-        # Run many findall operations
+        # Run many findall operations, materializing every result
         for _ in range(1000):
             results = findall(pattern, text)
             assert len(results) == 1000
+            assert results[-1].named["id"] == 999
             # Consume results to ensure they're not kept in memory
             del results
 
@@ -132,6 +133,32 @@ def test_findall_memory_usage():
         pytest.skip("pympler not available, skipping detailed memory tracking")
 
 
+@pytest.mark.slow
+def test_findall_iter_memory_usage():
+    """Test memory usage when streaming matches with findall_iter"""
+    _skip_pympler_on_pypy()
+    try:
+        from pympler import tracker
+
+        tr = tracker.SummaryTracker()
+
+        pattern = "ID:{id:d}"
+        text = " ".join([f"ID:{i}" for i in range(1000)])
+        parser = compile(pattern)
+
+        tr.print_diff()
+
+        # Stream matches so only one result object is alive at a time
+        for _ in range(1000):
+            count = sum(1 for _ in parser.findall_iter(text))
+            assert count == 1000
+
+        tr.print_diff()
+
+    except ImportError:
+        pytest.skip("pympler not available, skipping detailed memory tracking")
+
+
 def test_pattern_compilation_memory():
     """Test that pattern compilation doesn't leak memory"""
     num_patterns = 1000
@@ -324,6 +324,12 @@ def test_flexible_dates_single_digit():
     assert r.named["dt"] == date(2023, 1, 1)
 
 
+def test_flexible_dates_single_digit_dash():
+    r = parse("{dt:%Y-%m-%d}", "2024-1-5")
+    assert r.named["dt"] == date(2024, 1, 5)
+    assert parse("{dt:%Y-%m-%d}", "2024\\-1\\-5") is None
+
+
 def test_flexible_dates_j():
     r = parse("{dt:%Y/%j}", "2023/9")
     assert r.named["dt"] == date(2023, 1, 9)
@@ -1,6 +1,6 @@
 import pytest
 
-from formatparse import Result
+from formatparse import Result, compile
 
 
 def test_fixed_access():
@@ -36,3 +36,34 @@ def test_contains():
     assert "spam" in r
     assert "cat" not in r
     assert "ham" not in r
+
+
+def test_named_keys_shared_across_parses():
+    p = compile("{name}: {age:d}")
+    a = p.parse("Alice: 30")
+    b = p.parse("Bob: 25")
+    assert a.named == {"name": "Alice", "age": 30}
+    keys_a = {k: k for k in a.named}
+    for k in b.named:
+        assert k is keys_a[k]
+
+
+def test_span_keys_shared_with_named():
+    r = compile("{name}: {age:d}").parse("Alice: 30")
+    assert r.spans == {"name": (0, 5), "age": (7, 9)}
+    named_keys = {k: k for k in r.named}
+    for k in r.spans:
+        assert k is named_keys[k]
+
+
+def test_named_dict_built_once_and_shared():
+    r = compile("{name}: {age:d}").parse("Alice: 30")
+    assert r.named is r.named
+    r.named["age"] = 31
+    assert r.named == {"name": "Alice", "age": 31}
+    assert r["age"] == 31
+    assert "named={'age': 31, 'name': 'Alice'}" in repr(r)
+    del r.named["name"]
+    assert "name" not in r
+    assert "named={'age': 31}" in repr(r)
+    assert "named={'age': 31}" in str(r)
@@ -87,6 +87,25 @@ def test_redos_protection_complex_pattern():
     assert elapsed < 1.0, f"Pattern compilation took {elapsed}s, possible ReDoS"
 
 
+def test_many_fields_no_exponential_backtracking():
+    """Ambiguous many-field patterns fail in linear time on near-miss input"""
+    # Nineteen lazy ``{}`` fields can each absorb any number of the spaces, so a
+    # backtracking matcher would try every way of splitting 5000 words among them
+    # before finding that the final ``{:d}`` never gets digits before the "!".
+    pattern = "{} " * 19 + "{:d}!"
+    input_text = "a " * 5000 + "x!"
+    # The input holds every literal of the pattern in order (and ends with "!"),
+    # so the literal prefilter passes it and the regex engine has to run.
+    assert input_text.count(" ") >= 19 and input_text.endswith("!")
+
+    start = time.time()
+    assert parse(pattern, input_text) is None
+    assert search(pattern, input_text) is None
+    elapsed = time.time() - start
+
+    assert elapsed < 1.0, f"Matching took {elapsed}s, possible ReDoS"
+
+
 def test_oversized_pattern_compilation():
     """Test that compiling oversized patterns fails gracefully"""
     # Pattern that's just under the limit should work